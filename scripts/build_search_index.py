@@ -86,7 +86,7 @@ def get_all_certifications() -> List[Dict[str, Any]]:
         # Load from shards
         shard_map = load_json(map_path)
         for shard in shard_map.get("shards", []):
-            shard_file = shard["file"].replace("/data/", "")
+            shard_file = shard.get("rel_path") or shard["file"].replace("/data/", "")
             shard_path = DATA_DIR / shard_file
             
             if shard_path.exists():
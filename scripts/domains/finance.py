@@ -5,9 +5,10 @@ import pathlib
 sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
 from utils.slugify import slugify
 
-def produce() -> list[dict]:
-    """Returns list of normalized certifications for Finance domain."""
-    now = datetime.utcnow().isoformat() + "Z"
+def produce(now: str | None = None) -> list[dict]:
+    """Returns list of normalized certifications for Finance domain checked at `now` (default: current UTC)."""
+    if now is None:
+        now = datetime.utcnow().isoformat() + "Z"
     
     seeds = [
         {
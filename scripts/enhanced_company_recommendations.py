@@ -211,7 +211,7 @@ def generate_enhanced_recommendations():
         # Load from shards
         shard_map = load_json(map_path)
         for shard in shard_map.get("shards", []):
-            shard_file = shard["file"].replace("/data/", "")
+            shard_file = shard.get("rel_path") or shard["file"].replace("/data/", "")
             shard_path = DATA_DIR / shard_file
             if shard_path.exists():
                 certs_data.extend(load_json(shard_path))
@@ -11,6 +11,7 @@ Generates realistic certification data for the CertRank platform with:
 import json
 import random
 import uuid
+from dataclasses import dataclass, fields
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 import os
@@ -318,6 +319,44 @@ VOCABULARIES = {
     "equipment_type": ["Systems", "Equipment", "Installation", "Maintenance", "Repair", "Operations"]
 }
 
+@dataclass(slots=True)
+class Certification:
+    """A generated certification; serialized to a plain JSON object on save."""
+    id: int
+    slug: str
+    name: str
+    issuer: str
+    domain: str
+    level: str
+    duration: str
+    cost: int
+    currency: str
+    rating: float
+    total_reviews: int
+    job_postings: int
+    salary: Dict[str, int]
+    difficulty: str
+    validity_years: int
+    prerequisites: List[str]
+    skills: List[str]
+    description: str
+    exam_format: str
+    passing_score: int
+    languages: List[str]
+
+@dataclass(slots=True)
+class Company:
+    """A generated hiring company; serialized to a plain JSON object on save."""
+    company_id: int
+    slug: str
+    name: str
+    primary_domain: str
+    postings_30d: int
+    top_roles: Dict[str, int]
+    employee_count: str
+    industry: str
+    locations: List[str]
+
 def generate_certification_name(domain: str, issuer: str) -> str:
     """Generate realistic certification names based on domain and issuer."""
     templates = CERT_TEMPLATES.get(domain, CERT_TEMPLATES["cs-it"])
@@ -378,13 +417,14 @@ def generate_salary_data(domain: str) -> Dict:
         "avg": int(base["avg"] * variation)
     }
 
-def generate_certifications() -> List[Dict]:
-    """Generate comprehensive certification dataset."""
-    certifications = []
+def generate_certifications() -> Dict[str, List[Certification]]:
+    """Generate comprehensive certification dataset, partitioned by domain."""
+    certs_by_domain = {}
     cert_id = 1
     
     for domain, domain_info in DOMAINS.items():
         domain_cert_count = int(TOTAL_CERTIFICATIONS * domain_info["weight"])
+        certs_by_domain[domain] = domain_certs = []
         
         # Get issuers for this domain
         domain_issuers = {k: v for k, v in ISSUERS.items() if domain in v["domains"]}
@@ -400,7 +440,7 @@ def generate_certifications() -> List[Dict]:
             slug = create_slug(name)
             
             # Ensure unique slug
-            existing_slugs = [cert["slug"] for cert in certifications]
+            existing_slugs = [cert.slug for certs in certs_by_domain.values() for cert in certs]
             counter = 1
             original_slug = slug
             while slug in existing_slugs:
@@ -411,70 +451,71 @@ def generate_certifications() -> List[Dict]:
             duration_hours = random.choice([8, 16, 24, 40, 80, 120, 160, 200])
             duration = f"{duration_hours} hours" if duration_hours < 40 else f"{duration_hours//40} weeks"
             
-            certification = {
-                "id": cert_id,
-                "slug": slug,
-                "name": name,
-                "issuer": issuer,
-                "domain": domain,
-                "level": level,
-                "duration": duration,
-                "cost": generate_realistic_cost(issuer_data),
-                "currency": "USD",
-                "rating": generate_realistic_rating(),
-                "total_reviews": random.randint(10, 500),
-                "job_postings": generate_job_postings(),
-                "salary": generate_salary_data(domain),
-                "difficulty": random.choice(["Beginner", "Intermediate", "Advanced"]),
-                "validity_years": random.choice([2, 3, 4]),
-                "prerequisites": random.choice([[], ["Basic knowledge"], ["Previous certification"], ["Work experience"]]),
-                "skills": generate_skills(domain),
-                "description": f"Professional certification in {name.lower()} offered by {issuer}.",
-                "exam_format": random.choice(["Multiple Choice", "Practical", "Mixed", "Project-based"]),
-                "passing_score": random.randint(65, 85),
-                "languages": ["English"] + random.sample(["Spanish", "French", "German", "Portuguese"], k=random.randint(0, 2))
-            }
+            certification = Certification(
+                id=cert_id,
+                slug=slug,
+                name=name,
+                issuer=issuer,
+                domain=domain,
+                level=level,
+                duration=duration,
+                cost=generate_realistic_cost(issuer_data),
+                currency="USD",
+                rating=generate_realistic_rating(),
+                total_reviews=random.randint(10, 500),
+                job_postings=generate_job_postings(),
+                salary=generate_salary_data(domain),
+                difficulty=random.choice(["Beginner", "Intermediate", "Advanced"]),
+                validity_years=random.choice([2, 3, 4]),
+                prerequisites=random.choice([[], ["Basic knowledge"], ["Previous certification"], ["Work experience"]]),
+                skills=generate_skills(domain),
+                description=f"Professional certification in {name.lower()} offered by {issuer}.",
+                exam_format=random.choice(["Multiple Choice", "Practical", "Mixed", "Project-based"]),
+                passing_score=random.randint(65, 85),
+                languages=["English"] + random.sample(["Spanish", "French", "German", "Portuguese"], k=random.randint(0, 2))
+            )
             
-            certifications.append(certification)
+            domain_certs.append(certification)
             cert_id += 1
     
-    return certifications
+    return certs_by_domain
+
+# Skills each domain's certifications draw from
+SKILL_POOLS = {
+    "cs-it": (
+        "Cloud Computing", "DevOps", "Kubernetes", "Docker", "AWS", "Azure", "Python", 
+        "Linux", "Network Security", "Database Management", "API Development", 
+        "Microservices", "CI/CD", "Infrastructure as Code", "System Administration"
+    ),
+    "engineering-business": (
+        "Project Management", "Agile", "Scrum", "Lean Management", "Process Improvement",
+        "Business Analysis", "Risk Management", "Quality Assurance", "Leadership",
+        "Strategic Planning", "Change Management", "Six Sigma"
+    ),
+    "healthcare": (
+        "Patient Care", "Medical Procedures", "Healthcare Compliance", "Electronic Health Records",
+        "Medical Imaging", "Clinical Assessment", "Emergency Response", "Pharmacology",
+        "Infection Control", "Medical Equipment", "Healthcare Analytics"
+    ),
+    "finance": (
+        "Financial Analysis", "Risk Assessment", "Investment Management", "Regulatory Compliance",
+        "Financial Modeling", "Portfolio Management", "Trading", "Banking", "Insurance",
+        "Financial Planning", "Accounting", "Auditing"
+    ),
+    "skilled-trades": (
+        "Safety Procedures", "Equipment Operation", "Troubleshooting", "Installation",
+        "Maintenance", "Blueprint Reading", "Quality Control", "Tool Proficiency",
+        "Electrical Systems", "Mechanical Systems", "Construction", "Inspection"
+    )
+}
 
 def generate_skills(domain: str) -> List[str]:
     """Generate relevant skills for certification based on domain."""
-    skill_pools = {
-        "cs-it": [
-            "Cloud Computing", "DevOps", "Kubernetes", "Docker", "AWS", "Azure", "Python", 
-            "Linux", "Network Security", "Database Management", "API Development", 
-            "Microservices", "CI/CD", "Infrastructure as Code", "System Administration"
-        ],
-        "engineering-business": [
-            "Project Management", "Agile", "Scrum", "Lean Management", "Process Improvement",
-            "Business Analysis", "Risk Management", "Quality Assurance", "Leadership",
-            "Strategic Planning", "Change Management", "Six Sigma"
-        ],
-        "healthcare": [
-            "Patient Care", "Medical Procedures", "Healthcare Compliance", "Electronic Health Records",
-            "Medical Imaging", "Clinical Assessment", "Emergency Response", "Pharmacology",
-            "Infection Control", "Medical Equipment", "Healthcare Analytics"
-        ],
-        "finance": [
-            "Financial Analysis", "Risk Assessment", "Investment Management", "Regulatory Compliance",
-            "Financial Modeling", "Portfolio Management", "Trading", "Banking", "Insurance",
-            "Financial Planning", "Accounting", "Auditing"
-        ],
-        "skilled-trades": [
-            "Safety Procedures", "Equipment Operation", "Troubleshooting", "Installation",
-            "Maintenance", "Blueprint Reading", "Quality Control", "Tool Proficiency",
-            "Electrical Systems", "Mechanical Systems", "Construction", "Inspection"
-        ]
-    }
-    
-    pool = skill_pools.get(domain, skill_pools["cs-it"])
+    pool = SKILL_POOLS.get(domain, SKILL_POOLS["cs-it"])
     return random.sample(pool, k=random.randint(3, 8))
 
-def generate_companies() -> List[Dict]:
-    """Generate comprehensive company dataset."""
+def generate_companies() -> Dict[str, List[Company]]:
+    """Generate comprehensive company dataset, partitioned by primary domain."""
     company_names = [
         "TechCorp", "InnovateNow", "DataDriven Solutions", "CloudFirst Technologies",
         "SecureNet Systems", "AnalyticsPro", "DevOps Masters", "ScaleTech",
@@ -484,7 +525,7 @@ def generate_companies() -> List[Dict]:
         "ManufacturingTech", "QualityAssurance Systems"
     ] + [f"Company{i}" for i in range(21, TOTAL_COMPANIES + 1)]
     
-    companies = []
+    companies_by_domain = {}
     for i, name in enumerate(company_names[:TOTAL_COMPANIES], 1):
         # Assign primary domain
         primary_domain = random.choices(
@@ -498,66 +539,65 @@ def generate_companies() -> List[Dict]:
         roles = generate_company_roles(primary_domain)
         total_postings = sum(roles.values())
         
-        company = {
-            "company_id": i,
-            "slug": slug,
-            "name": name,
-            "primary_domain": primary_domain,
-            "postings_30d": total_postings,
-            "top_roles": roles,
-            "employee_count": random.choice(["1-50", "51-200", "201-1000", "1000-5000", "5000+"]),
-            "industry": get_industry_for_domain(primary_domain),
-            "locations": random.sample(["New York", "San Francisco", "Austin", "Seattle", "Chicago", "Boston", "Remote"], k=random.randint(1, 4))
-        }
+        company = Company(
+            company_id=i,
+            slug=slug,
+            name=name,
+            primary_domain=primary_domain,
+            postings_30d=total_postings,
+            top_roles=roles,
+            employee_count=random.choice(["1-50", "51-200", "201-1000", "1000-5000", "5000+"]),
+            industry=get_industry_for_domain(primary_domain),
+            locations=random.sample(["New York", "San Francisco", "Austin", "Seattle", "Chicago", "Boston", "Remote"], k=random.randint(1, 4))
+        )
         
-        companies.append(company)
+        companies_by_domain.setdefault(primary_domain, []).append(company)
     
-    return companies
+    return companies_by_domain
+
+# Job roles each domain hires for
+ROLE_POOLS = {
+    "cs-it": (
+        "Software Engineer", "DevOps Engineer", "Cloud Architect", "Data Scientist",
+        "Security Engineer", "Full Stack Developer", "System Administrator",
+        "Database Administrator", "Network Engineer", "Product Manager"
+    ),
+    "engineering-business": (
+        "Project Manager", "Business Analyst", "Process Engineer", "Quality Engineer",
+        "Operations Manager", "Scrum Master", "Product Owner", "Program Manager",
+        "Business Operations", "Strategy Consultant"
+    ),
+    "healthcare": (
+        "Registered Nurse", "Medical Technician", "Healthcare Administrator",
+        "Clinical Specialist", "Medical Assistant", "Pharmacy Technician",
+        "Radiology Tech", "Emergency Medical Technician", "Clinical Coordinator"
+    ),
+    "finance": (
+        "Financial Analyst", "Investment Advisor", "Risk Manager", "Compliance Officer",
+        "Portfolio Manager", "Credit Analyst", "Banking Associate", "Auditor",
+        "Financial Planner", "Quantitative Analyst"
+    ),
+    "skilled-trades": (
+        "Electrician", "HVAC Technician", "Welder", "Carpenter", "Plumber",
+        "Construction Worker", "Equipment Operator", "Safety Inspector",
+        "Maintenance Technician", "Industrial Mechanic"
+    )
+}
+
+# Per-role job count buckets (low, high) and their cumulative weights (60% / 30% / 10%)
+JOB_COUNT_BUCKETS = ((1, 5), (6, 20), (21, 50))
+JOB_COUNT_CUM_WEIGHTS = (0.6, 0.9, 1.0)
 
 def generate_company_roles(domain: str) -> Dict[str, int]:
     """Generate realistic job roles and counts for a company in a specific domain."""
-    role_pools = {
-        "cs-it": [
-            "Software Engineer", "DevOps Engineer", "Cloud Architect", "Data Scientist",
-            "Security Engineer", "Full Stack Developer", "System Administrator",
-            "Database Administrator", "Network Engineer", "Product Manager"
-        ],
-        "engineering-business": [
-            "Project Manager", "Business Analyst", "Process Engineer", "Quality Engineer",
-            "Operations Manager", "Scrum Master", "Product Owner", "Program Manager",
-            "Business Operations", "Strategy Consultant"
-        ],
-        "healthcare": [
-            "Registered Nurse", "Medical Technician", "Healthcare Administrator",
-            "Clinical Specialist", "Medical Assistant", "Pharmacy Technician",
-            "Radiology Tech", "Emergency Medical Technician", "Clinical Coordinator"
-        ],
-        "finance": [
-            "Financial Analyst", "Investment Advisor", "Risk Manager", "Compliance Officer",
-            "Portfolio Manager", "Credit Analyst", "Banking Associate", "Auditor",
-            "Financial Planner", "Quantitative Analyst"
-        ],
-        "skilled-trades": [
-            "Electrician", "HVAC Technician", "Welder", "Carpenter", "Plumber",
-            "Construction Worker", "Equipment Operator", "Safety Inspector",
-            "Maintenance Technician", "Industrial Mechanic"
-        ]
-    }
-    
-    pool = role_pools[domain]
+    pool = ROLE_POOLS[domain]
     num_roles = random.randint(3, 7)
     selected_roles = random.sample(pool, k=num_roles)
     
-    roles = {}
-    for role in selected_roles:
-        # Generate realistic job counts with power law distribution
-        count = random.choices(
-            [random.randint(1, 5), random.randint(6, 20), random.randint(21, 50)],
-            weights=[0.6, 0.3, 0.1]
-        )[0]
-        roles[role] = count
-    
-    return roles
+    # Generate realistic job counts with power law distribution: draw every
+    # role's bucket in one call, then a single randint from the chosen bucket
+    buckets = random.choices(JOB_COUNT_BUCKETS, cum_weights=JOB_COUNT_CUM_WEIGHTS, k=num_roles)
+    return {role: random.randint(low, high) for role, (low, high) in zip(selected_roles, buckets)}
 
 def get_industry_for_domain(domain: str) -> str:
     """Map domain to realistic industry."""
@@ -570,70 +610,97 @@ def get_industry_for_domain(domain: str) -> str:
     }
     return industry_map[domain]
 
-def generate_company_recommendations(certifications: List[Dict], companies: List[Dict]) -> Dict:
-    """Generate certification recommendations for each company."""
-    recommendations = {}
-    
-    for domain in DOMAINS.keys():
-        recommendations[domain] = {}
-        domain_companies = [c for c in companies if c["primary_domain"] == domain]
-        domain_certifications = [c for c in certifications if c["domain"] == domain]
-        
-        for company in domain_companies:
-            company_recs = []
+def generate_and_stream_recommendations(
+    certs_by_domain: Dict[str, List[Certification]],
+    companies_by_domain: Dict[str, List[Company]],
+    out_path: Path
+) -> int:
+    """Generate certification recommendations and stream them to disk company by company.
+
+    The output keeps the nested ``{domain: {company_slug: [recs]}}`` layout of
+    ``recommendations.json``, but each company's list is serialized and written as
+    soon as it is computed so peak memory no longer grows with the company count.
+    Returns the number of companies written.
+    """
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    written = 0
+    
+    with open(out_path, 'w', encoding='utf-8', buffering=1 << 21) as f:
+        f.write("{")
+        for d_index, domain in enumerate(DOMAINS.keys()):
+            domain_companies = companies_by_domain.get(domain, [])
+            domain_certifications = certs_by_domain.get(domain, [])
             
-            # Select top certifications for this company
-            num_recommendations = min(random.randint(5, 15), len(domain_certifications))
-            selected_certs = random.sample(domain_certifications, k=num_recommendations)
+            f.write(",\n  " if d_index else "\n  ")
+            f.write(f"{json.dumps(domain, ensure_ascii=False)}: {{")
             
-            for cert in selected_certs:
-                # Generate realistic fit scores and signals
-                role_alignment = random.uniform(0.2, 0.9)
-                issuer_affinity = random.uniform(0.1, 0.8)
-                global_rank_norm = random.uniform(0.3, 1.0)
-                cost_penalty = random.uniform(0.0, 0.15)
+            for c_index, company in enumerate(domain_companies):
+                company_recs = []
                 
-                fit_score = (role_alignment * 0.4 + issuer_affinity * 0.3 + global_rank_norm * 0.3) - cost_penalty
-                fit_score = max(0.1, min(1.0, fit_score))  # Clamp between 0.1 and 1.0
+                # Select top certifications for this company
+                num_recommendations = min(random.randint(5, 15), len(domain_certifications))
+                selected_certs = random.sample(domain_certifications, k=num_recommendations)
                 
-                recommendation = {
-                    "slug": cert["slug"],
-                    "fit_score": round(fit_score, 3),
-                    "signals": {
-                        "role_alignment": round(role_alignment, 3),
-                        "issuer_affinity": round(issuer_affinity, 3),
-                        "global_rank_norm": round(global_rank_norm, 3),
-                        "cost_penalty": round(cost_penalty, 3),
-                        "mention_count": random.randint(0, 20),
-                        "mention_z": round(random.uniform(-1.0, 3.0), 2)
+                for cert in selected_certs:
+                    # Generate realistic fit scores and signals
+                    role_alignment = random.uniform(0.2, 0.9)
+                    issuer_affinity = random.uniform(0.1, 0.8)
+                    global_rank_norm = random.uniform(0.3, 1.0)
+                    cost_penalty = random.uniform(0.0, 0.15)
+                    
+                    fit_score = (role_alignment * 0.4 + issuer_affinity * 0.3 + global_rank_norm * 0.3) - cost_penalty
+                    fit_score = max(0.1, min(1.0, fit_score))  # Clamp between 0.1 and 1.0
+                    
+                    recommendation = {
+                        "slug": cert.slug,
+                        "fit_score": round(fit_score, 3),
+                        "signals": {
+                            "role_alignment": round(role_alignment, 3),
+                            "issuer_affinity": round(issuer_affinity, 3),
+                            "global_rank_norm": round(global_rank_norm, 3),
+                            "cost_penalty": round(cost_penalty, 3),
+                            "mention_count": random.randint(0, 20),
+                            "mention_z": round(random.uniform(-1.0, 3.0), 2)
+                        }
                     }
-                }
-                company_recs.append(recommendation)
+                    company_recs.append(recommendation)
+                
+                # Sort by fit score
+                company_recs.sort(key=lambda x: x["fit_score"], reverse=True)
+                
+                # Emit this company's entry at the same indentation json.dump(indent=2) would use
+                recs_json = json.dumps(company_recs, indent=2, ensure_ascii=False).replace("\n", "\n    ")
+                f.write(",\n    " if c_index else "\n    ")
+                f.write(f"{json.dumps(company.slug, ensure_ascii=False)}: {recs_json}")
+                written += 1
             
-            # Sort by fit score
-            company_recs.sort(key=lambda x: x["fit_score"], reverse=True)
-            recommendations[domain][company["slug"]] = company_recs
+            f.write("\n  }" if domain_companies else "}")
+        f.write("\n}")
     
-    return recommendations
+    print(f"✅ Saved {out_path}")
+    return written
 
-def generate_rankings_data(certifications: List[Dict]) -> Dict:
+def generate_rankings_data(certs_by_domain: Dict[str, List[Certification]]) -> Dict:
     """Generate ranking data for today and trends."""
     today_rankings = []
     
     for domain in DOMAINS.keys():
-        domain_certs = [c for c in certifications if c["domain"] == domain]
         # Sort by a composite score (rating + job_postings)
-        domain_certs.sort(key=lambda x: x["rating"] * 0.6 + (x["job_postings"] / 1000) * 0.4, reverse=True)
+        domain_certs = sorted(
+            certs_by_domain.get(domain, []),
+            key=lambda x: x.rating * 0.6 + (x.job_postings / 1000) * 0.4,
+            reverse=True
+        )
         
         for rank, cert in enumerate(domain_certs[:20], 1):  # Top 20 per domain
             today_rankings.append({
                 "rank": rank,
-                "slug": cert["slug"],
-                "name": cert["name"],
-                "issuer": cert["issuer"],
+                "slug": cert.slug,
+                "name": cert.name,
+                "issuer": cert.issuer,
                 "domain": domain,
-                "rating": cert["rating"],
-                "job_postings": cert["job_postings"],
+                "rating": cert.rating,
+                "job_postings": cert.job_postings,
                 "trend": random.choice(["up", "down", "stable"]),
                 "change": random.randint(-5, 5)
             })
@@ -653,11 +720,17 @@ def generate_rankings_data(certifications: List[Dict]) -> Dict:
         "trends": trends
     }
 
+def _json_default(obj: Any) -> Dict:
+    """Serialize slotted record dataclasses as plain JSON objects."""
+    if isinstance(obj, (Certification, Company)):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 def save_json_data(data: Any, filepath: Path) -> None:
     """Save data as JSON with pretty formatting."""
     filepath.parent.mkdir(parents=True, exist_ok=True)
     with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+        json.dump(data, f, indent=2, ensure_ascii=False, default=_json_default)
     print(f"✅ Saved {filepath}")
 
 def main():
@@ -667,57 +740,45 @@ def main():
     
     # Generate core data
     print("\n📋 Generating certifications...")
-    certifications = generate_certifications()
-    print(f"✅ Generated {len(certifications)} certifications")
+    certs_by_domain = generate_certifications()
+    total_certifications = sum(len(certs) for certs in certs_by_domain.values())
+    print(f"✅ Generated {total_certifications} certifications")
     
     print("🏢 Generating companies...")
-    companies = generate_companies()
-    print(f"✅ Generated {len(companies)} companies")
+    companies_by_domain = generate_companies()
+    total_companies = sum(len(domain_companies) for domain_companies in companies_by_domain.values())
+    print(f"✅ Generated {total_companies} companies")
     
     print("🎯 Generating company recommendations...")
-    recommendations = generate_company_recommendations(certifications, companies)
+    generate_and_stream_recommendations(certs_by_domain, companies_by_domain, OUTPUT_DIR / "companies/recommendations.json")
     print("✅ Generated company recommendations")
     
     print("📈 Generating rankings...")
-    rankings_data = generate_rankings_data(certifications)
+    rankings_data = generate_rankings_data(certs_by_domain)
     print("✅ Generated rankings and trends")
     
     # Save all data
     print("\n💾 Saving data files...")
     
     # Certifications by domain (for sharded service)
-    certs_by_domain = {}
-    for cert in certifications:
-        domain = cert["domain"]
-        if domain not in certs_by_domain:
-            certs_by_domain[domain] = []
-        certs_by_domain[domain].append(cert)
-    
     for domain, certs in certs_by_domain.items():
         save_json_data(certs, OUTPUT_DIR / f"certifications/{domain}.json")
     
     # Companies data
-    companies_by_domain = {}
-    for company in companies:
-        domain = company["primary_domain"]
-        if domain not in companies_by_domain:
-            companies_by_domain[domain] = []
-        companies_by_domain[domain].append(company)
-    
     save_json_data(companies_by_domain, OUTPUT_DIR / "companies/by_domain.json")
-    save_json_data(recommendations, OUTPUT_DIR / "companies/recommendations.json")
     
     # Rankings
     save_json_data(rankings_data["today"], OUTPUT_DIR / "rankings/today.json")
     save_json_data(rankings_data["trends"], OUTPUT_DIR / "rankings/trends.json")
     
-    # Generate manifest
+    # Generate manifest (one timestamp shared by the manifest and all shards)
+    generated_at = datetime.now().isoformat()
     manifest = {
         "version": "2.0.0",
-        "generated_at": datetime.now().isoformat(),
+        "generated_at": generated_at,
         "stats": {
-            "total_certifications": len(certifications),
-            "total_companies": len(companies),
+            "total_certifications": total_certifications,
+            "total_companies": total_companies,
             "domains": len(DOMAINS),
             "issuers": len(ISSUERS)
         },
@@ -725,7 +786,7 @@ def main():
             domain: {
                 "file": f"certifications/{domain}.json",
                 "count": len(certs),
-                "last_updated": datetime.now().isoformat()
+                "last_updated": generated_at
             }
             for domain, certs in certs_by_domain.items()
         }
@@ -734,13 +795,13 @@ def main():
     
     # Summary statistics
     print(f"\n📊 Data Generation Complete!")
-    print(f"   • {len(certifications)} certifications across {len(DOMAINS)} domains")
+    print(f"   • {total_certifications} certifications across {len(DOMAINS)} domains")
     print(f"   • {len(ISSUERS)} certification issuers")  
-    print(f"   • {len(companies)} companies with hiring data")
+    print(f"   • {total_companies} companies with hiring data")
     print(f"   • Rankings for top certifications per domain")
     print(f"   • Company-specific certification recommendations")
     
-    domain_counts = {domain: len([c for c in certifications if c["domain"] == domain]) for domain in DOMAINS}
+    domain_counts = {domain: len(certs_by_domain.get(domain, [])) for domain in DOMAINS}
     print(f"\n📈 Certifications by Domain:")
     for domain, count in domain_counts.items():
         print(f"   • {DOMAINS[domain]['label']}: {count}")
@@ -8,18 +8,33 @@ Generates 1000+ certifications across 33 domains for the CertRank platform with:
 - Advanced skill mappings and market analysis
 """
 
+import gzip
 import json
 import random
-import uuid
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+import re
+import string
+from array import array
+from collections import defaultdict
+from dataclasses import dataclass, fields
+from datetime import datetime
+from heapq import nsmallest
+from itertools import accumulate
+from operator import itemgetter
+from typing import Dict, List, Any, Optional, Tuple
 import os
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configuration
 TOTAL_CERTIFICATIONS = 1200
 TOTAL_COMPANIES = 500
 OUTPUT_DIR = Path("../web/public/data")
+WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB file buffers for the large JSON outputs
+WRITE_GZIP_COPIES = False  # Also write pre-compressed .json.gz beside the compact (served) outputs
 
 # Comprehensive domain definitions (33 domains total)
 DOMAINS = {
@@ -70,6 +85,14 @@ DOMAINS = {
     "environmental": {"label": "Environmental & Sustainability", "emoji": "🌱", "weight": 0.005}
 }
 
+# Parallel domain key / weight sequences for weighted sampling without per-call dict walks
+DOMAIN_KEYS = tuple(DOMAINS)
+DOMAIN_WEIGHTS = tuple(info["weight"] for info in DOMAINS.values())
+DOMAIN_CUM_WEIGHTS = tuple(accumulate(DOMAIN_WEIGHTS))
+
+# Display titles used in descriptions ("cs-it" -> "Cs It"), built once per domain
+DOMAIN_TITLES = {domain: domain.replace('-', ' ').title() for domain in DOMAINS}
+
 # Massive issuer database (120+ issuers)
 ISSUERS = {
     # Technology & Cloud Computing
@@ -429,6 +452,30 @@ ISSUERS = {
     }
 }
 
+def build_domain_issuer_index() -> Dict[str, Tuple[str, ...]]:
+    """Invert ISSUERS into a domain -> issuer names index, preserving ISSUERS order.
+
+    Every domain gets an entry; domains no issuer lists fall back to the first five issuers.
+    """
+    index = defaultdict(list)
+    for issuer, issuer_info in ISSUERS.items():
+        for domain in issuer_info["domains"]:
+            index[domain].append(issuer)
+    fallback = tuple(ISSUERS)[:5]
+    return {domain: tuple(index.get(domain, fallback)) for domain in DOMAINS}
+
+# Leading word of each issuer name, as used in "{issuer}" name placeholders
+ISSUER_FIRST_WORDS = {issuer: issuer.split()[0] for issuer in ISSUERS}
+
+# Issuers that certify in each domain (built once instead of scanning ISSUERS per domain)
+DOMAIN_ISSUERS = build_domain_issuer_index()
+
+# Cumulative popularity weights aligned with DOMAIN_ISSUERS, so issuer draws skip the per-call accumulate
+DOMAIN_ISSUER_CUM_WEIGHTS = {
+    domain: tuple(accumulate(ISSUERS[issuer]["popularity"] for issuer in issuers))
+    for domain, issuers in DOMAIN_ISSUERS.items()
+}
+
 # Enhanced certification name templates for all domains
 CERT_TEMPLATES = {
     "cs-it": [
@@ -799,371 +846,498 @@ VOCABULARIES = {
     "env_system": ["ISO 14001", "LEED", "BREEAM", "Energy Star", "Carbon Trust"]
 }
 
-def generate_certification_name(domain: str, issuer: str) -> str:
-    """Generate realistic certification names based on domain and issuer."""
-    templates = CERT_TEMPLATES.get(domain, CERT_TEMPLATES["cs-it"])
-    template = random.choice(templates)
-    
-    # Replace placeholders with appropriate vocabulary
-    name = template
-    for key, values in VOCABULARIES.items():
-        if f"{{{key}}}" in name:
-            name = name.replace(f"{{{key}}}", random.choice(values))
+# A parsed name template: the format string and the (placeholder, word list) pairs it draws from
+NameTemplate = Tuple[str, Tuple[Tuple[str, List[str]], ...]]
+
+def compile_name_template(template: str) -> NameTemplate:
+    """Parse a name template once and bind the vocabulary word lists it draws from.
+
+    Vocabularies are kept in VOCABULARIES order so names draw their words in a stable order.
+    """
+    placeholders = {field for _, field, _, _ in string.Formatter().parse(template) if field}
+    return template, tuple((key, words) for key, words in VOCABULARIES.items() if key in placeholders)
+
+# Name templates pre-parsed per domain, so rendering is one format_map pass instead of str.replace scans
+CERT_TEMPLATES_COMPILED = {
+    domain: [compile_name_template(template) for template in templates]
+    for domain, templates in CERT_TEMPLATES.items()
+}
+
+def get_domain_name_templates(domain: str) -> List[NameTemplate]:
+    """Compiled name templates for a domain, falling back to the cs-it set."""
+    return CERT_TEMPLATES_COMPILED.get(domain, CERT_TEMPLATES_COMPILED["cs-it"])
+
+def generate_certification_name(templates: List[NameTemplate], issuer: str) -> str:
+    """Generate a realistic certification name from a domain's compiled templates and an issuer."""
+    template, vocabularies = random.choice(templates)
     
-    name = name.replace("{issuer}", issuer.split()[0])  # Use first word of issuer
+    # Fill placeholders with appropriate vocabulary
+    choice = random.choice
+    values = {key: choice(words) for key, words in vocabularies}
+    values["issuer"] = ISSUER_FIRST_WORDS[issuer]  # Use first word of issuer
     
-    return name
+    return template.format_map(values)
+
+# Slug patterns, compiled once instead of looked up in the re cache per call
+_NON_WORD_RE = re.compile(r'[^\w\s-]')
+_SEP_RE = re.compile(r'[\s_-]+')
+
+# ASCII fast path: drop punctuation and turn separators into '-' in one C-level translate pass
+_SLUG_TABLE = str.maketrans(
+    {c: '-' for c in map(chr, range(128)) if c.isspace() or c in '_-'}
+    | {c: None for c in map(chr, range(128)) if not (c.isalnum() or c.isspace() or c in '_-')}
+)
 
 def create_slug(name: str) -> str:
     """Create URL-friendly slug from certification name."""
-    import re
-    slug = re.sub(r'[^\w\s-]', '', name.lower())
-    slug = re.sub(r'[\s_-]+', '-', slug)
+    if name.isascii():
+        return '-'.join(part for part in name.lower().translate(_SLUG_TABLE).split('-') if part)
+    slug = _NON_WORD_RE.sub('', name.lower())
+    slug = _SEP_RE.sub('-', slug)
     return slug.strip('-')
 
-def generate_realistic_rating() -> float:
-    """Generate realistic rating with bias towards higher ratings."""
-    return round(random.uniform(3.2, 4.9), 1)
+def generate_realistic_ratings(count: int) -> List[float]:
+    """Generate a column of realistic ratings with bias towards higher ratings."""
+    uniform = random.uniform
+    return [round(uniform(3.2, 4.9), 1) for _ in range(count)]
 
-def generate_realistic_cost(issuer_data: Dict) -> int:
-    """Generate realistic cost based on issuer average with variation."""
-    base_cost = issuer_data["avg_cost"]
-    if base_cost == 0:  # Free certifications
-        return 0
-    variation = random.uniform(0.7, 1.4)  # ±40% variation
-    return int(base_cost * variation)
+# Job posting count buckets (low, high): lower / medium / high / very high demand
+JOB_POSTING_BUCKETS = ((5, 50), (51, 200), (201, 800), (801, 3000))
+JOB_POSTING_BUCKET_CUM_WEIGHTS = tuple(accumulate((0.40, 0.30, 0.25, 0.05)))
 
-def generate_job_postings() -> int:
-    """Generate realistic job posting counts with power law distribution."""
-    return random.choices([
-        random.randint(5, 50),      # 40% - Lower demand
-        random.randint(51, 200),    # 30% - Medium demand  
-        random.randint(201, 800),   # 25% - High demand
-        random.randint(801, 3000)   # 5% - Very high demand
-    ], weights=[0.40, 0.30, 0.25, 0.05])[0]
+def generate_job_postings(count: int) -> List[int]:
+    """Generate a column of realistic job posting counts with power law distribution."""
+    # Pick every demand bucket in one draw, then one count per row from its bucket
+    buckets = random.choices(JOB_POSTING_BUCKETS, cum_weights=JOB_POSTING_BUCKET_CUM_WEIGHTS, k=count)
+    randint = random.randint
+    return [randint(low, high) for low, high in buckets]
 
-def generate_salary_data(domain: str) -> Dict:
-    """Generate salary ranges based on domain with realistic variations."""
-    base_salaries = {
-        # Technology & Computing - Higher salaries
-        "cs-it": {"min": 70000, "max": 160000, "avg": 105000},
-        "cybersecurity": {"min": 80000, "max": 180000, "avg": 120000},
-        "cloud-computing": {"min": 85000, "max": 200000, "avg": 130000},
-        "data-science": {"min": 90000, "max": 220000, "avg": 140000},
-        "artificial-intelligence": {"min": 100000, "max": 250000, "avg": 160000},
-        "software-development": {"min": 75000, "max": 180000, "avg": 115000},
-        "networking": {"min": 65000, "max": 140000, "avg": 95000},
-        "database-management": {"min": 70000, "max": 150000, "avg": 100000},
-        
-        # Business & Management - Mid to high range
-        "project-management": {"min": 70000, "max": 150000, "avg": 100000},
-        "business-analysis": {"min": 65000, "max": 130000, "avg": 90000},
-        "digital-marketing": {"min": 50000, "max": 120000, "avg": 75000},
-        "supply-chain": {"min": 60000, "max": 130000, "avg": 85000},
-        "human-resources": {"min": 55000, "max": 120000, "avg": 80000},
-        "sales": {"min": 45000, "max": 150000, "avg": 85000},
-        
-        # Finance & Accounting - High range
-        "finance": {"min": 70000, "max": 200000, "avg": 120000},
-        "accounting": {"min": 50000, "max": 140000, "avg": 85000},
-        "risk-management": {"min": 80000, "max": 180000, "avg": 115000},
-        "insurance": {"min": 55000, "max": 130000, "avg": 85000},
-        
-        # Healthcare & Life Sciences - Wide range
-        "healthcare": {"min": 50000, "max": 130000, "avg": 80000},
-        "nursing": {"min": 60000, "max": 120000, "avg": 85000},
-        "pharmacy": {"min": 80000, "max": 140000, "avg": 105000},
-        "medical-technology": {"min": 55000, "max": 120000, "avg": 80000},
-        
-        # Manufacturing & Engineering - Mid to high range
-        "manufacturing": {"min": 55000, "max": 120000, "avg": 80000},
-        "quality-assurance": {"min": 60000, "max": 130000, "avg": 85000},
-        "mechanical-engineering": {"min": 70000, "max": 140000, "avg": 95000},
-        "electrical-engineering": {"min": 75000, "max": 150000, "avg": 105000},
-        
-        # Skilled Trades & Construction - Lower to mid range
-        "skilled-trades": {"min": 40000, "max": 90000, "avg": 65000},
-        "construction": {"min": 45000, "max": 100000, "avg": 70000},
-        "automotive": {"min": 40000, "max": 85000, "avg": 60000},
-        
-        # Other Professional Areas
-        "education": {"min": 40000, "max": 80000, "avg": 55000},
-        "legal": {"min": 70000, "max": 180000, "avg": 115000},
-        "environmental": {"min": 50000, "max": 110000, "avg": 75000}
-    }
+# Salary ranges (USD) per domain, before per-certification variation
+BASE_SALARIES = {
+    # Technology & Computing - Higher salaries
+    "cs-it": {"min": 70000, "max": 160000, "avg": 105000},
+    "cybersecurity": {"min": 80000, "max": 180000, "avg": 120000},
+    "cloud-computing": {"min": 85000, "max": 200000, "avg": 130000},
+    "data-science": {"min": 90000, "max": 220000, "avg": 140000},
+    "artificial-intelligence": {"min": 100000, "max": 250000, "avg": 160000},
+    "software-development": {"min": 75000, "max": 180000, "avg": 115000},
+    "networking": {"min": 65000, "max": 140000, "avg": 95000},
+    "database-management": {"min": 70000, "max": 150000, "avg": 100000},
+    
+    # Business & Management - Mid to high range
+    "project-management": {"min": 70000, "max": 150000, "avg": 100000},
+    "business-analysis": {"min": 65000, "max": 130000, "avg": 90000},
+    "digital-marketing": {"min": 50000, "max": 120000, "avg": 75000},
+    "supply-chain": {"min": 60000, "max": 130000, "avg": 85000},
+    "human-resources": {"min": 55000, "max": 120000, "avg": 80000},
+    "sales": {"min": 45000, "max": 150000, "avg": 85000},
+    
+    # Finance & Accounting - High range
+    "finance": {"min": 70000, "max": 200000, "avg": 120000},
+    "accounting": {"min": 50000, "max": 140000, "avg": 85000},
+    "risk-management": {"min": 80000, "max": 180000, "avg": 115000},
+    "insurance": {"min": 55000, "max": 130000, "avg": 85000},
+    
+    # Healthcare & Life Sciences - Wide range
+    "healthcare": {"min": 50000, "max": 130000, "avg": 80000},
+    "nursing": {"min": 60000, "max": 120000, "avg": 85000},
+    "pharmacy": {"min": 80000, "max": 140000, "avg": 105000},
+    "medical-technology": {"min": 55000, "max": 120000, "avg": 80000},
+    
+    # Manufacturing & Engineering - Mid to high range
+    "manufacturing": {"min": 55000, "max": 120000, "avg": 80000},
+    "quality-assurance": {"min": 60000, "max": 130000, "avg": 85000},
+    "mechanical-engineering": {"min": 70000, "max": 140000, "avg": 95000},
+    "electrical-engineering": {"min": 75000, "max": 150000, "avg": 105000},
+    
+    # Skilled Trades & Construction - Lower to mid range
+    "skilled-trades": {"min": 40000, "max": 90000, "avg": 65000},
+    "construction": {"min": 45000, "max": 100000, "avg": 70000},
+    "automotive": {"min": 40000, "max": 85000, "avg": 60000},
     
-    base = base_salaries.get(domain, {"min": 50000, "max": 100000, "avg": 75000})
-    # Add some variation
-    variation = random.uniform(0.85, 1.15)
+    # Other Professional Areas
+    "education": {"min": 40000, "max": 80000, "avg": 55000},
+    "legal": {"min": 70000, "max": 180000, "avg": 115000},
+    "environmental": {"min": 50000, "max": 110000, "avg": 75000}
+}
+DEFAULT_SALARY = {"min": 50000, "max": 100000, "avg": 75000}
+
+# Skills each domain's certifications draw from
+SKILL_POOLS = {
+    # Technology & Computing
+    "cs-it": (
+        "Cloud Computing", "DevOps", "Kubernetes", "Docker", "AWS", "Azure", "Python", 
+        "Linux", "Network Security", "Database Management", "API Development", 
+        "Microservices", "CI/CD", "Infrastructure as Code", "System Administration"
+    ),
+    "cybersecurity": (
+        "Penetration Testing", "Vulnerability Assessment", "Incident Response", 
+        "SIEM", "Threat Intelligence", "Forensics", "Risk Assessment", 
+        "Security Architecture", "Compliance", "Ethical Hacking", "Malware Analysis"
+    ),
+    "cloud-computing": (
+        "AWS", "Azure", "Google Cloud", "Kubernetes", "Docker", "Terraform", 
+        "CloudFormation", "Serverless", "Microservices", "DevOps", "Container Orchestration"
+    ),
+    "data-science": (
+        "Python", "R", "SQL", "Machine Learning", "Statistics", "Data Visualization", 
+        "Tableau", "Power BI", "Hadoop", "Spark", "TensorFlow", "Data Mining"
+    ),
+    "artificial-intelligence": (
+        "Machine Learning", "Deep Learning", "Neural Networks", "TensorFlow", "PyTorch", 
+        "Computer Vision", "NLP", "Python", "Statistics", "Data Science", "AI Ethics"
+    ),
+    "software-development": (
+        "JavaScript", "Python", "Java", "React", "Node.js", "Git", "Agile", 
+        "REST APIs", "Database Design", "Testing", "DevOps", "Mobile Development"
+    ),
+    "networking": (
+        "TCP/IP", "Routing", "Switching", "Firewalls", "VPN", "Wireless", 
+        "Network Security", "CISCO", "BGP", "OSPF", "Network Monitoring"
+    ),
+    "database-management": (
+        "SQL", "Oracle", "MySQL", "PostgreSQL", "MongoDB", "Data Modeling", 
+        "Performance Tuning", "Backup & Recovery", "Database Security", "NoSQL"
+    ),
     
-    return {
-        "min": int(base["min"] * variation),
-        "max": int(base["max"] * variation),
-        "avg": int(base["avg"] * variation)
-    }
+    # Business & Management
+    "project-management": (
+        "PMP", "Agile", "Scrum", "Kanban", "Risk Management", "Stakeholder Management", 
+        "Budget Management", "Team Leadership", "Communication", "Quality Management"
+    ),
+    "business-analysis": (
+        "Requirements Analysis", "Process Modeling", "Data Analysis", "Stakeholder Management", 
+        "Business Process Improvement", "Agile BA", "SQL", "Documentation", "Testing"
+    ),
+    "digital-marketing": (
+        "SEO", "SEM", "Social Media Marketing", "Content Marketing", "Email Marketing", 
+        "Google Analytics", "PPC", "Marketing Automation", "Conversion Optimization"
+    ),
+    "supply-chain": (
+        "Supply Chain Management", "Logistics", "Procurement", "Inventory Management", 
+        "Demand Planning", "Lean Manufacturing", "Six Sigma", "ERP Systems"
+    ),
+    "human-resources": (
+        "Talent Acquisition", "Performance Management", "Employee Relations", 
+        "Compensation & Benefits", "Training & Development", "HR Analytics", "Compliance"
+    ),
+    "sales": (
+        "Sales Process", "CRM", "Lead Generation", "Account Management", 
+        "Negotiation", "Presentation Skills", "Sales Analytics", "Customer Relations"
+    ),
+    
+    # Finance & Accounting
+    "finance": (
+        "Financial Analysis", "Risk Assessment", "Investment Management", "Financial Modeling", 
+        "Portfolio Management", "Derivatives", "Fixed Income", "Equity Analysis"
+    ),
+    "accounting": (
+        "Financial Accounting", "Management Accounting", "Tax Accounting", "Auditing", 
+        "Financial Reporting", "Cost Accounting", "Budgeting", "GAAP", "IFRS"
+    ),
+    "risk-management": (
+        "Risk Assessment", "Risk Modeling", "Regulatory Compliance", "Basel III", 
+        "Credit Risk", "Market Risk", "Operational Risk", "Risk Analytics"
+    ),
+    "insurance": (
+        "Underwriting", "Claims Management", "Actuarial Science", "Risk Assessment", 
+        "Insurance Law", "Reinsurance", "Product Development", "Regulatory Compliance"
+    ),
+    
+    # Healthcare & Life Sciences
+    "healthcare": (
+        "Patient Care", "Medical Procedures", "Healthcare Compliance", "Electronic Health Records",
+        "Medical Coding", "Healthcare Analytics", "Quality Improvement", "Patient Safety"
+    ),
+    "nursing": (
+        "Patient Assessment", "Medication Administration", "Clinical Skills", 
+        "Patient Education", "Care Planning", "Emergency Response", "IV Therapy"
+    ),
+    "pharmacy": (
+        "Pharmacology", "Drug Interactions", "Patient Counseling", "Medication Therapy", 
+        "Pharmaceutical Care", "Compounding", "Clinical Pharmacy", "Pharmacy Law"
+    ),
+    "medical-technology": (
+        "Medical Equipment", "Laboratory Testing", "Quality Control", "Regulatory Compliance", 
+        "Medical Imaging", "Diagnostic Testing", "Equipment Maintenance", "Safety Protocols"
+    ),
+    
+    # Manufacturing & Engineering
+    "manufacturing": (
+        "Lean Manufacturing", "Six Sigma", "Quality Control", "Production Planning", 
+        "Process Improvement", "Safety Management", "Equipment Maintenance", "ISO 9001"
+    ),
+    "quality-assurance": (
+        "Quality Management", "Statistical Process Control", "Root Cause Analysis", 
+        "Auditing", "ISO Standards", "Six Sigma", "Quality Planning", "Corrective Actions"
+    ),
+    "mechanical-engineering": (
+        "CAD Design", "Materials Science", "Thermodynamics", "Fluid Mechanics", 
+        "Manufacturing Processes", "Project Management", "FEA Analysis", "Product Development"
+    ),
+    "electrical-engineering": (
+        "Circuit Design", "Power Systems", "Control Systems", "Electronics", 
+        "Signal Processing", "Embedded Systems", "PLC Programming", "Electrical Safety"
+    ),
+    
+    # Skilled Trades & Construction
+    "skilled-trades": (
+        "Safety Procedures", "Equipment Operation", "Troubleshooting", "Installation",
+        "Maintenance", "Blueprint Reading", "Quality Control", "Hand Tools", "Power Tools"
+    ),
+    "construction": (
+        "Construction Management", "Safety Management", "Project Planning", "Cost Estimation", 
+        "Quality Control", "Building Codes", "Contract Management", "Scheduling"
+    ),
+    "automotive": (
+        "Diagnostic Testing", "Engine Repair", "Electrical Systems", "Brake Systems", 
+        "Transmission Repair", "Air Conditioning", "Hybrid Technology", "Computer Diagnostics"
+    ),
+    
+    # Other Professional Areas
+    "education": (
+        "Instructional Design", "Adult Learning", "Curriculum Development", "Assessment", 
+        "E-Learning", "Training Delivery", "Learning Management Systems", "Educational Technology"
+    ),
+    "legal": (
+        "Legal Research", "Contract Law", "Regulatory Compliance", "Risk Management", 
+        "Privacy Law", "Corporate Law", "Litigation", "Legal Writing"
+    ),
+    "environmental": (
+        "Environmental Assessment", "Sustainability", "Environmental Compliance", 
+        "Carbon Management", "Renewable Energy", "Waste Management", "Green Building"
+    )
+}
 
 def generate_skills(domain: str) -> List[str]:
     """Generate relevant skills for certification based on domain."""
-    skill_pools = {
-        # Technology & Computing
-        "cs-it": [
-            "Cloud Computing", "DevOps", "Kubernetes", "Docker", "AWS", "Azure", "Python", 
-            "Linux", "Network Security", "Database Management", "API Development", 
-            "Microservices", "CI/CD", "Infrastructure as Code", "System Administration"
-        ],
-        "cybersecurity": [
-            "Penetration Testing", "Vulnerability Assessment", "Incident Response", 
-            "SIEM", "Threat Intelligence", "Forensics", "Risk Assessment", 
-            "Security Architecture", "Compliance", "Ethical Hacking", "Malware Analysis"
-        ],
-        "cloud-computing": [
-            "AWS", "Azure", "Google Cloud", "Kubernetes", "Docker", "Terraform", 
-            "CloudFormation", "Serverless", "Microservices", "DevOps", "Container Orchestration"
-        ],
-        "data-science": [
-            "Python", "R", "SQL", "Machine Learning", "Statistics", "Data Visualization", 
-            "Tableau", "Power BI", "Hadoop", "Spark", "TensorFlow", "Data Mining"
-        ],
-        "artificial-intelligence": [
-            "Machine Learning", "Deep Learning", "Neural Networks", "TensorFlow", "PyTorch", 
-            "Computer Vision", "NLP", "Python", "Statistics", "Data Science", "AI Ethics"
-        ],
-        "software-development": [
-            "JavaScript", "Python", "Java", "React", "Node.js", "Git", "Agile", 
-            "REST APIs", "Database Design", "Testing", "DevOps", "Mobile Development"
-        ],
-        "networking": [
-            "TCP/IP", "Routing", "Switching", "Firewalls", "VPN", "Wireless", 
-            "Network Security", "CISCO", "BGP", "OSPF", "Network Monitoring"
-        ],
-        "database-management": [
-            "SQL", "Oracle", "MySQL", "PostgreSQL", "MongoDB", "Data Modeling", 
-            "Performance Tuning", "Backup & Recovery", "Database Security", "NoSQL"
-        ],
-        
-        # Business & Management
-        "project-management": [
-            "PMP", "Agile", "Scrum", "Kanban", "Risk Management", "Stakeholder Management", 
-            "Budget Management", "Team Leadership", "Communication", "Quality Management"
-        ],
-        "business-analysis": [
-            "Requirements Analysis", "Process Modeling", "Data Analysis", "Stakeholder Management", 
-            "Business Process Improvement", "Agile BA", "SQL", "Documentation", "Testing"
-        ],
-        "digital-marketing": [
-            "SEO", "SEM", "Social Media Marketing", "Content Marketing", "Email Marketing", 
-            "Google Analytics", "PPC", "Marketing Automation", "Conversion Optimization"
-        ],
-        "supply-chain": [
-            "Supply Chain Management", "Logistics", "Procurement", "Inventory Management", 
-            "Demand Planning", "Lean Manufacturing", "Six Sigma", "ERP Systems"
-        ],
-        "human-resources": [
-            "Talent Acquisition", "Performance Management", "Employee Relations", 
-            "Compensation & Benefits", "Training & Development", "HR Analytics", "Compliance"
-        ],
-        "sales": [
-            "Sales Process", "CRM", "Lead Generation", "Account Management", 
-            "Negotiation", "Presentation Skills", "Sales Analytics", "Customer Relations"
-        ],
-        
-        # Finance & Accounting
-        "finance": [
-            "Financial Analysis", "Risk Assessment", "Investment Management", "Financial Modeling", 
-            "Portfolio Management", "Derivatives", "Fixed Income", "Equity Analysis"
-        ],
-        "accounting": [
-            "Financial Accounting", "Management Accounting", "Tax Accounting", "Auditing", 
-            "Financial Reporting", "Cost Accounting", "Budgeting", "GAAP", "IFRS"
-        ],
-        "risk-management": [
-            "Risk Assessment", "Risk Modeling", "Regulatory Compliance", "Basel III", 
-            "Credit Risk", "Market Risk", "Operational Risk", "Risk Analytics"
-        ],
-        "insurance": [
-            "Underwriting", "Claims Management", "Actuarial Science", "Risk Assessment", 
-            "Insurance Law", "Reinsurance", "Product Development", "Regulatory Compliance"
-        ],
-        
-        # Healthcare & Life Sciences
-        "healthcare": [
-            "Patient Care", "Medical Procedures", "Healthcare Compliance", "Electronic Health Records",
-            "Medical Coding", "Healthcare Analytics", "Quality Improvement", "Patient Safety"
-        ],
-        "nursing": [
-            "Patient Assessment", "Medication Administration", "Clinical Skills", 
-            "Patient Education", "Care Planning", "Emergency Response", "IV Therapy"
-        ],
-        "pharmacy": [
-            "Pharmacology", "Drug Interactions", "Patient Counseling", "Medication Therapy", 
-            "Pharmaceutical Care", "Compounding", "Clinical Pharmacy", "Pharmacy Law"
-        ],
-        "medical-technology": [
-            "Medical Equipment", "Laboratory Testing", "Quality Control", "Regulatory Compliance", 
-            "Medical Imaging", "Diagnostic Testing", "Equipment Maintenance", "Safety Protocols"
-        ],
-        
-        # Manufacturing & Engineering
-        "manufacturing": [
-            "Lean Manufacturing", "Six Sigma", "Quality Control", "Production Planning", 
-            "Process Improvement", "Safety Management", "Equipment Maintenance", "ISO 9001"
-        ],
-        "quality-assurance": [
-            "Quality Management", "Statistical Process Control", "Root Cause Analysis", 
-            "Auditing", "ISO Standards", "Six Sigma", "Quality Planning", "Corrective Actions"
-        ],
-        "mechanical-engineering": [
-            "CAD Design", "Materials Science", "Thermodynamics", "Fluid Mechanics", 
-            "Manufacturing Processes", "Project Management", "FEA Analysis", "Product Development"
-        ],
-        "electrical-engineering": [
-            "Circuit Design", "Power Systems", "Control Systems", "Electronics", 
-            "Signal Processing", "Embedded Systems", "PLC Programming", "Electrical Safety"
-        ],
-        
-        # Skilled Trades & Construction
-        "skilled-trades": [
-            "Safety Procedures", "Equipment Operation", "Troubleshooting", "Installation",
-            "Maintenance", "Blueprint Reading", "Quality Control", "Hand Tools", "Power Tools"
-        ],
-        "construction": [
-            "Construction Management", "Safety Management", "Project Planning", "Cost Estimation", 
-            "Quality Control", "Building Codes", "Contract Management", "Scheduling"
-        ],
-        "automotive": [
-            "Diagnostic Testing", "Engine Repair", "Electrical Systems", "Brake Systems", 
-            "Transmission Repair", "Air Conditioning", "Hybrid Technology", "Computer Diagnostics"
-        ],
-        
-        # Other Professional Areas
-        "education": [
-            "Instructional Design", "Adult Learning", "Curriculum Development", "Assessment", 
-            "E-Learning", "Training Delivery", "Learning Management Systems", "Educational Technology"
-        ],
-        "legal": [
-            "Legal Research", "Contract Law", "Regulatory Compliance", "Risk Management", 
-            "Privacy Law", "Corporate Law", "Litigation", "Legal Writing"
-        ],
-        "environmental": [
-            "Environmental Assessment", "Sustainability", "Environmental Compliance", 
-            "Carbon Management", "Renewable Energy", "Waste Management", "Green Building"
-        ]
-    }
-    
-    pool = skill_pools.get(domain, skill_pools["cs-it"])
+    pool = SKILL_POOLS.get(domain, SKILL_POOLS["cs-it"])
     sample_size = min(random.randint(4, 10), len(pool))
     return random.sample(pool, k=sample_size)
 
-def generate_certifications() -> List[Dict]:
+def generate_top_skills(domain: str, count: int = 5) -> List[str]:
+    """Pick a domain's headline skills directly, without drawing a full skill list to truncate."""
+    pool = SKILL_POOLS.get(domain, SKILL_POOLS["cs-it"])
+    return random.sample(pool, k=min(count, len(pool)))
+
+@dataclass(slots=True)
+class Certification:
+    """One generated certification record; written out as a plain JSON object."""
+    id: int
+    slug: str
+    name: str
+    issuer: str
+    domain: str
+    level: str
+    duration: str
+    cost: int
+    currency: str
+    rating: float
+    total_reviews: int
+    job_postings: int
+    salary: Dict[str, int]
+    difficulty: str
+    validity_years: int
+    prerequisites: List[str]
+    skills: List[str]
+    description: str
+    exam_format: str
+    passing_score: int
+    languages: List[str]
+    ranking: int
+    created_at: str
+    updated_at: str
+
+# Categorical certification attributes and their cumulative weights (drawn a whole domain at a time)
+CERT_LEVELS = ("Foundational", "Associate", "Professional", "Expert", "Specialty")
+CERT_LEVEL_CUM_WEIGHTS = tuple(accumulate((0.15, 0.30, 0.35, 0.15, 0.05)))
+DURATION_HOURS = (8, 16, 24, 40, 80, 120, 160, 200)
+DURATION_CUM_WEIGHTS = tuple(accumulate((0.15, 0.20, 0.20, 0.20, 0.15, 0.05, 0.03, 0.02)))
+# One shared label string per duration instead of a fresh f-string per certification
+DURATION_LABELS = {
+    hours: f"{hours} hours" if hours < 40 else f"{hours//40} weeks"
+    for hours in DURATION_HOURS
+}
+DIFFICULTIES = ("Beginner", "Intermediate", "Advanced")
+DIFFICULTY_CUM_WEIGHTS = tuple(accumulate((0.25, 0.50, 0.25)))
+VALIDITY_YEARS = (1, 2, 3, 4, 5)
+VALIDITY_CUM_WEIGHTS = tuple(accumulate((0.05, 0.25, 0.40, 0.25, 0.05)))
+PREREQUISITES = (
+    (),
+    ("Basic knowledge in the field",),
+    ("Previous certification required",),
+    ("1+ years work experience",),
+    ("Bachelor's degree or equivalent",)
+)
+PREREQUISITE_CUM_WEIGHTS = tuple(accumulate((0.30, 0.30, 0.15, 0.20, 0.05)))
+EXAM_FORMATS = ("Multiple Choice", "Practical", "Mixed", "Project-based", "Oral")
+EXAM_FORMAT_CUM_WEIGHTS = tuple(accumulate((0.40, 0.25, 0.20, 0.10, 0.05)))
+# Uniform integer ranges, drawn a whole domain at a time via random.choices (no per-draw randint overhead)
+TOTAL_REVIEWS_RANGE = range(15, 801)
+PASSING_SCORE_RANGE = range(65, 86)
+# Languages offered besides English, sampled without replacement
+EXTRA_LANGUAGES = ("Spanish", "French", "German", "Portuguese", "Chinese", "Japanese")
+EXTRA_LANGUAGE_COUNTS = range(0, 4)
+
+def build_certification(
+    cert_id: int, domain: str, issuer: str, name: str, slug: str,
+    level: str, duration_hours: int, difficulty: str, validity_years: int,
+    prerequisites: Tuple[str, ...], exam_format: str, total_reviews: int, passing_score: int,
+    rating: float, job_postings: int, extra_language_count: int, timestamp: str
+) -> Certification:
+    """Build one certification record; depends only on its arguments and the random stream."""
+    # Cost varies ±40% around the issuer average; free certifications stay free
+    base_cost = ISSUERS[issuer]["avg_cost"]
+    cost = int(base_cost * random.uniform(0.7, 1.4)) if base_cost else 0
+    
+    # Salary range scaled by one variation factor for the domain baseline
+    base_salary = BASE_SALARIES.get(domain, DEFAULT_SALARY)
+    salary_variation = random.uniform(0.85, 1.15)
+    
+    return Certification(
+        id=cert_id,
+        slug=slug,
+        name=name,
+        issuer=issuer,
+        domain=domain,
+        level=level,
+        duration=DURATION_LABELS[duration_hours],
+        cost=cost,
+        currency="USD",
+        rating=rating,
+        total_reviews=total_reviews,
+        job_postings=job_postings,
+        salary={
+            "min": int(base_salary["min"] * salary_variation),
+            "max": int(base_salary["max"] * salary_variation),
+            "avg": int(base_salary["avg"] * salary_variation)
+        },
+        difficulty=difficulty,
+        validity_years=validity_years,
+        prerequisites=list(prerequisites),
+        skills=generate_skills(domain),
+        description=f"Professional certification in {name.lower()} offered by {issuer}. Validates expertise in {DOMAIN_TITLES[domain]} and related technologies.",
+        exam_format=exam_format,
+        passing_score=passing_score,
+        languages=["English"] + random.sample(EXTRA_LANGUAGES, k=extra_language_count),
+        ranking=cert_id,  # Will be reordered later based on composite score
+        created_at=timestamp,
+        updated_at=timestamp
+    )
+
+def composite_score(cert: Certification) -> float:
+    """Score a certification for the global ranking (rating, demand, reviews, cost, some noise)."""
+    return (
+        cert.rating * 0.3 + 
+        (cert.job_postings / 1000) * 0.3 +
+        (cert.total_reviews / 100) * 0.2 +
+        (5 - cert.cost / 200) * 0.1 +  # Lower cost is better
+        random.uniform(0.8, 1.2) * 0.1  # Some randomness
+    )
+
+def generate_certifications() -> List[Certification]:
     """Generate massive certification dataset across all domains."""
     certifications = []
     cert_id = 1
     used_slugs = set()
+    next_slug_suffix = {}  # base slug -> next numeric suffix to try
+    timestamp = datetime.now().isoformat()  # One creation time for the whole batch
+    composite_scores = array('d')  # Ranking scores as packed doubles, kept alongside the records rather than on them
     
-    for domain, domain_info in DOMAINS.items():
-        domain_cert_count = int(TOTAL_CERTIFICATIONS * domain_info["weight"])
+    for domain, domain_weight in zip(DOMAIN_KEYS, DOMAIN_WEIGHTS):
+        domain_cert_count = int(TOTAL_CERTIFICATIONS * domain_weight)
         
-        # Get issuers for this domain
-        domain_issuers = {k: v for k, v in ISSUERS.items() if domain in v["domains"]}
+        # Select every issuer for this domain up front, weighted by popularity
+        domain_issuer_picks = random.choices(
+            DOMAIN_ISSUERS[domain], cum_weights=DOMAIN_ISSUER_CUM_WEIGHTS[domain], k=domain_cert_count
+        )
         
-        if not domain_issuers:  # Fallback if no specific issuers
-            domain_issuers = {k: v for k, v in list(ISSUERS.items())[:5]}
+        # Resolve the domain's name templates once; every certification below reuses them
+        domain_templates = get_domain_name_templates(domain)
         
-        for _ in range(domain_cert_count):
-            # Select issuer based on popularity
-            issuer_weights = [data["popularity"] for data in domain_issuers.values()]
-            issuer = random.choices(list(domain_issuers.keys()), weights=issuer_weights)[0]
-            issuer_data = domain_issuers[issuer]
-            
+        # Draw the categorical attributes for the whole domain in one call each
+        levels = random.choices(CERT_LEVELS, cum_weights=CERT_LEVEL_CUM_WEIGHTS, k=domain_cert_count)
+        durations = random.choices(DURATION_HOURS, cum_weights=DURATION_CUM_WEIGHTS, k=domain_cert_count)
+        difficulties = random.choices(DIFFICULTIES, cum_weights=DIFFICULTY_CUM_WEIGHTS, k=domain_cert_count)
+        validities = random.choices(VALIDITY_YEARS, cum_weights=VALIDITY_CUM_WEIGHTS, k=domain_cert_count)
+        prerequisite_picks = random.choices(PREREQUISITES, cum_weights=PREREQUISITE_CUM_WEIGHTS, k=domain_cert_count)
+        exam_formats = random.choices(EXAM_FORMATS, cum_weights=EXAM_FORMAT_CUM_WEIGHTS, k=domain_cert_count)
+        
+        # ...and the numeric columns
+        review_counts = random.choices(TOTAL_REVIEWS_RANGE, k=domain_cert_count)
+        passing_scores = random.choices(PASSING_SCORE_RANGE, k=domain_cert_count)
+        ratings = generate_realistic_ratings(domain_cert_count)
+        job_posting_counts = generate_job_postings(domain_cert_count)
+        extra_language_counts = random.choices(EXTRA_LANGUAGE_COUNTS, k=domain_cert_count)
+        
+        # Zip the columns back into one record per certification
+        for (
+            issuer, level, duration_hours, difficulty, validity_years, prerequisites, exam_format,
+            total_reviews, passing_score, rating, job_postings, extra_language_count
+        ) in zip(
+            domain_issuer_picks, levels, durations, difficulties, validities, prerequisite_picks, exam_formats,
+            review_counts, passing_scores, ratings, job_posting_counts, extra_language_counts
+        ):
             # Generate certification data
-            name = generate_certification_name(domain, issuer)
+            name = generate_certification_name(domain_templates, issuer)
             slug = create_slug(name)
             
-            # Ensure unique slug
-            counter = 1
-            original_slug = slug
-            while slug in used_slugs:
+            # Ensure unique slug, resuming from the last suffix handed out for this base slug
+            if slug in used_slugs:
+                original_slug = slug
+                counter = next_slug_suffix.get(original_slug, 1)
+                while f"{original_slug}-{counter}" in used_slugs:
+                    counter += 1
+                next_slug_suffix[original_slug] = counter + 1
                 slug = f"{original_slug}-{counter}"
-                counter += 1
             used_slugs.add(slug)
             
-            level = random.choices(
-                ["Foundational", "Associate", "Professional", "Expert", "Specialty"],
-                weights=[0.15, 0.30, 0.35, 0.15, 0.05]
-            )[0]
-            
-            duration_hours = random.choices(
-                [8, 16, 24, 40, 80, 120, 160, 200],
-                weights=[0.15, 0.20, 0.20, 0.20, 0.15, 0.05, 0.03, 0.02]
-            )[0]
-            
-            duration = f"{duration_hours} hours" if duration_hours < 40 else f"{duration_hours//40} weeks"
-            
-            certification = {
-                "id": cert_id,
-                "slug": slug,
-                "name": name,
-                "issuer": issuer,
-                "domain": domain,
-                "level": level,
-                "duration": duration,
-                "cost": generate_realistic_cost(issuer_data),
-                "currency": "USD",
-                "rating": generate_realistic_rating(),
-                "total_reviews": random.randint(15, 800),
-                "job_postings": generate_job_postings(),
-                "salary": generate_salary_data(domain),
-                "difficulty": random.choices(
-                    ["Beginner", "Intermediate", "Advanced"], 
-                    weights=[0.25, 0.50, 0.25]
-                )[0],
-                "validity_years": random.choices([1, 2, 3, 4, 5], weights=[0.05, 0.25, 0.40, 0.25, 0.05])[0],
-                "prerequisites": random.choices([
-                    [],
-                    ["Basic knowledge in the field"],
-                    ["Previous certification required"],
-                    ["1+ years work experience"],
-                    ["Bachelor's degree or equivalent"]
-                ], weights=[0.30, 0.30, 0.15, 0.20, 0.05])[0],
-                "skills": generate_skills(domain),
-                "description": f"Professional certification in {name.lower()} offered by {issuer}. Validates expertise in {domain.replace('-', ' ').title()} and related technologies.",
-                "exam_format": random.choices(
-                    ["Multiple Choice", "Practical", "Mixed", "Project-based", "Oral"],
-                    weights=[0.40, 0.25, 0.20, 0.10, 0.05]
-                )[0],
-                "passing_score": random.randint(65, 85),
-                "languages": ["English"] + random.sample(
-                    ["Spanish", "French", "German", "Portuguese", "Chinese", "Japanese"], 
-                    k=random.randint(0, 3)
-                ),
-                "ranking": cert_id,  # Will be reordered later based on composite score
-                "created_at": datetime.now().isoformat(),
-                "updated_at": datetime.now().isoformat()
-            }
-            
+            certification = build_certification(
+                cert_id, domain, issuer, name, slug,
+                level, duration_hours, difficulty, validity_years, prerequisites, exam_format,
+                total_reviews, passing_score, rating, job_postings, extra_language_count, timestamp
+            )
             certifications.append(certification)
+            composite_scores.append(composite_score(certification))
             cert_id += 1
     
-    # Generate rankings based on composite score
-    for cert in certifications:
-        composite_score = (
-            cert["rating"] * 0.3 + 
-            (cert["job_postings"] / 1000) * 0.3 +
-            (cert["total_reviews"] / 100) * 0.2 +
-            (5 - cert["cost"] / 200) * 0.1 +  # Lower cost is better
-            random.uniform(0.8, 1.2) * 0.1  # Some randomness
-        )
-        cert["composite_score"] = composite_score
-    
     # Sort by composite score and assign rankings
-    certifications.sort(key=lambda x: x["composite_score"], reverse=True)
+    order = sorted(range(len(certifications)), key=composite_scores.__getitem__, reverse=True)
+    certifications = [certifications[i] for i in order]
     for i, cert in enumerate(certifications, 1):
-        cert["ranking"] = i
-        del cert["composite_score"]  # Remove temporary field
+        cert.ranking = i
     
     return certifications
 
-def generate_companies() -> List[Dict]:
+# Office locations companies are spread across, sampled without replacement
+COMPANY_LOCATIONS = (
+    "New York", "San Francisco", "Austin", "Seattle", "Chicago", "Boston", 
+    "Los Angeles", "Denver", "Atlanta", "Dallas", "Remote", "Washington DC",
+    "Phoenix", "San Diego", "Portland", "Miami", "Philadelphia", "Detroit"
+)
+
+@dataclass(slots=True)
+class Company:
+    """One generated hiring company; written out as a plain JSON object."""
+    company_id: int
+    slug: str
+    name: str
+    primary_domain: str
+    postings_30d: int
+    top_roles: Dict[str, int]
+    employee_count: str
+    industry: str
+    locations: List[str]
+    founded_year: int
+    company_size: str
+
+# Company size bands with cumulative weights precomputed once rather than per company
+EMPLOYEE_COUNTS = ("1-50", "51-200", "201-1000", "1000-5000", "5000+")
+EMPLOYEE_COUNT_CUM_WEIGHTS = tuple(accumulate((0.40, 0.30, 0.20, 0.08, 0.02)))
+COMPANY_SIZES = ("Startup", "Small", "Medium", "Large", "Enterprise")
+COMPANY_SIZE_CUM_WEIGHTS = tuple(accumulate((0.25, 0.35, 0.25, 0.10, 0.05)))
+
+def generate_companies() -> List[Company]:
     """Generate comprehensive company dataset with realistic hiring data."""
     company_names = [
         # Technology Companies
@@ -1193,337 +1367,420 @@ def generate_companies() -> List[Dict]:
         # Additional Generic Companies
     ] + [f"Company{i:03d}" for i in range(1, TOTAL_COMPANIES - 69)]
     
+    company_names = company_names[:TOTAL_COMPANIES]
+    
+    # Assign primary domains with realistic distribution, all in one draw
+    primary_domains = random.choices(DOMAIN_KEYS, cum_weights=DOMAIN_CUM_WEIGHTS, k=len(company_names))
+    
     companies = []
-    for i, name in enumerate(company_names[:TOTAL_COMPANIES], 1):
-        # Assign primary domain with realistic distribution
-        primary_domain = random.choices(
-            list(DOMAINS.keys()), 
-            weights=[info["weight"] for info in DOMAINS.values()]
-        )[0]
-        
+    for i, (name, primary_domain) in enumerate(zip(company_names, primary_domains), 1):
         slug = name.lower().replace(" ", "-").replace(".", "")
         
         # Generate job postings for different roles
         roles = generate_company_roles(primary_domain)
         total_postings = sum(roles.values())
         
-        company = {
-            "company_id": i,
-            "slug": slug,
-            "name": name,
-            "primary_domain": primary_domain,
-            "postings_30d": total_postings,
-            "top_roles": roles,
-            "employee_count": random.choices(
-                ["1-50", "51-200", "201-1000", "1000-5000", "5000+"],
-                weights=[0.40, 0.30, 0.20, 0.08, 0.02]
-            )[0],
-            "industry": get_industry_for_domain(primary_domain),
-            "locations": random.sample([
-                "New York", "San Francisco", "Austin", "Seattle", "Chicago", "Boston", 
-                "Los Angeles", "Denver", "Atlanta", "Dallas", "Remote", "Washington DC",
-                "Phoenix", "San Diego", "Portland", "Miami", "Philadelphia", "Detroit"
-            ], k=random.randint(1, 5)),
-            "founded_year": random.randint(1990, 2020),
-            "company_size": random.choices(
-                ["Startup", "Small", "Medium", "Large", "Enterprise"],
-                weights=[0.25, 0.35, 0.25, 0.10, 0.05]
-            )[0]
-        }
+        company = Company(
+            company_id=i,
+            slug=slug,
+            name=name,
+            primary_domain=primary_domain,
+            postings_30d=total_postings,
+            top_roles=roles,
+            employee_count=random.choices(EMPLOYEE_COUNTS, cum_weights=EMPLOYEE_COUNT_CUM_WEIGHTS)[0],
+            industry=get_industry_for_domain(primary_domain),
+            locations=random.sample(COMPANY_LOCATIONS, k=random.randint(1, 5)),
+            founded_year=random.randint(1990, 2020),
+            company_size=random.choices(COMPANY_SIZES, cum_weights=COMPANY_SIZE_CUM_WEIGHTS)[0]
+        )
         
         companies.append(company)
     
     return companies
 
+# Job roles each domain hires for
+ROLE_POOLS = {
+    "cs-it": (
+        "Software Engineer", "DevOps Engineer", "Cloud Architect", "Data Scientist",
+        "Security Engineer", "Full Stack Developer", "System Administrator",
+        "Database Administrator", "Network Engineer", "Product Manager", "IT Support"
+    ),
+    "cybersecurity": (
+        "Security Analyst", "Penetration Tester", "Security Engineer", "CISO",
+        "Incident Response Specialist", "Security Consultant", "Compliance Officer",
+        "Security Architect", "Threat Intelligence Analyst", "Forensics Specialist"
+    ),
+    "cloud-computing": (
+        "Cloud Architect", "DevOps Engineer", "Cloud Engineer", "Site Reliability Engineer",
+        "Cloud Security Specialist", "Platform Engineer", "Infrastructure Engineer",
+        "Cloud Consultant", "Solutions Architect", "Cloud Operations"
+    ),
+    "data-science": (
+        "Data Scientist", "Data Analyst", "Machine Learning Engineer", "Data Engineer",
+        "Business Intelligence Analyst", "Research Scientist", "Statistician",
+        "Data Architect", "Analytics Manager", "Quantitative Analyst"
+    ),
+    "artificial-intelligence": (
+        "AI Research Scientist", "Machine Learning Engineer", "Data Scientist",
+        "AI Product Manager", "Computer Vision Engineer", "NLP Engineer",
+        "AI Ethics Specialist", "Robotics Engineer", "AI Consultant"
+    ),
+    "software-development": (
+        "Software Engineer", "Frontend Developer", "Backend Developer", "Full Stack Developer",
+        "Mobile Developer", "QA Engineer", "Technical Lead", "Software Architect",
+        "Product Manager", "UX/UI Designer", "DevOps Engineer"
+    ),
+    "networking": (
+        "Network Engineer", "Network Administrator", "Network Architect",
+        "Wireless Engineer", "Network Security Specialist", "NOC Engineer",
+        "Infrastructure Engineer", "Telecommunications Specialist"
+    ),
+    "database-management": (
+        "Database Administrator", "Database Developer", "Data Engineer",
+        "Database Architect", "Performance Tuning Specialist", "Data Analyst",
+        "ETL Developer", "Database Security Specialist"
+    ),
+    "project-management": (
+        "Project Manager", "Program Manager", "Scrum Master", "Product Owner",
+        "PMO Director", "Project Coordinator", "Agile Coach", "Portfolio Manager",
+        "Business Analyst", "Change Manager"
+    ),
+    "business-analysis": (
+        "Business Analyst", "Systems Analyst", "Process Analyst", "Data Analyst",
+        "Requirements Analyst", "Product Manager", "Strategy Consultant",
+        "Operations Analyst", "Quality Analyst"
+    ),
+    "digital-marketing": (
+        "Digital Marketing Manager", "SEO Specialist", "PPC Specialist", "Content Manager",
+        "Social Media Manager", "Marketing Analyst", "Email Marketing Specialist",
+        "Growth Hacker", "Marketing Automation Specialist", "Brand Manager"
+    ),
+    "supply-chain": (
+        "Supply Chain Manager", "Logistics Coordinator", "Procurement Specialist",
+        "Operations Manager", "Demand Planner", "Supply Chain Analyst",
+        "Warehouse Manager", "Vendor Manager", "Transportation Manager"
+    ),
+    "human-resources": (
+        "HR Manager", "Recruiter", "HR Business Partner", "Compensation Analyst",
+        "Training Manager", "HR Coordinator", "Talent Acquisition Specialist",
+        "Employee Relations Specialist", "HR Generalist", "Benefits Administrator"
+    ),
+    "finance": (
+        "Financial Analyst", "Investment Advisor", "Risk Manager", "Portfolio Manager",
+        "Credit Analyst", "Financial Planner", "Quantitative Analyst",
+        "Investment Banker", "Treasury Analyst", "Compliance Officer"
+    ),
+    "accounting": (
+        "Staff Accountant", "Senior Accountant", "Tax Accountant", "Auditor",
+        "Controller", "Accounting Manager", "Cost Accountant", "Payroll Specialist",
+        "Accounts Payable Specialist", "Financial Reporting Analyst"
+    ),
+    "risk-management": (
+        "Risk Analyst", "Risk Manager", "Compliance Officer", "Operational Risk Specialist",
+        "Market Risk Analyst", "Credit Risk Analyst", "Risk Consultant",
+        "Regulatory Affairs Specialist", "Internal Auditor"
+    ),
+    "insurance": (
+        "Insurance Agent", "Underwriter", "Claims Adjuster", "Actuary",
+        "Insurance Broker", "Risk Assessor", "Claims Manager",
+        "Product Manager", "Compliance Specialist", "Account Manager"
+    ),
+    "healthcare": (
+        "Registered Nurse", "Medical Assistant", "Healthcare Administrator",
+        "Medical Coder", "Health Information Technician", "Case Manager",
+        "Clinical Coordinator", "Quality Assurance Specialist", "Patient Care Coordinator"
+    ),
+    "nursing": (
+        "Registered Nurse", "Licensed Practical Nurse", "Nurse Practitioner",
+        "Charge Nurse", "Clinical Nurse", "OR Nurse", "ICU Nurse",
+        "Emergency Room Nurse", "Pediatric Nurse", "Psychiatric Nurse"
+    ),
+    "pharmacy": (
+        "Pharmacist", "Pharmacy Technician", "Clinical Pharmacist",
+        "Hospital Pharmacist", "Retail Pharmacist", "Pharmacy Manager",
+        "Drug Safety Specialist", "Pharmaceutical Sales Rep"
+    ),
+    "medical-technology": (
+        "Medical Laboratory Technician", "Radiology Technician", "MRI Technologist",
+        "Ultrasound Technician", "Nuclear Medicine Technologist",
+        "Cardiovascular Technologist", "Medical Equipment Technician"
+    ),
+    "manufacturing": (
+        "Production Manager", "Manufacturing Engineer", "Quality Control Inspector",
+        "Plant Manager", "Production Supervisor", "Process Engineer",
+        "Maintenance Technician", "Safety Manager", "Lean Manufacturing Specialist"
+    ),
+    "quality-assurance": (
+        "Quality Engineer", "QA Manager", "Quality Control Inspector",
+        "Six Sigma Black Belt", "Quality Analyst", "Compliance Specialist",
+        "Process Improvement Specialist", "Quality Coordinator"
+    ),
+    "mechanical-engineering": (
+        "Mechanical Engineer", "Design Engineer", "Product Engineer",
+        "Manufacturing Engineer", "Project Engineer", "R&D Engineer",
+        "CAD Designer", "Test Engineer", "Field Service Engineer"
+    ),
+    "electrical-engineering": (
+        "Electrical Engineer", "Electronics Engineer", "Control Systems Engineer",
+        "Power Systems Engineer", "RF Engineer", "Hardware Engineer",
+        "Embedded Systems Engineer", "Test Engineer", "Field Engineer"
+    ),
+    "skilled-trades": (
+        "Electrician", "HVAC Technician", "Welder", "Carpenter", "Plumber",
+        "Maintenance Technician", "Industrial Mechanic", "Machinist",
+        "Pipefitter", "Sheet Metal Worker", "Instrumentation Technician"
+    ),
+    "construction": (
+        "Construction Manager", "Project Manager", "Site Supervisor",
+        "Construction Worker", "Equipment Operator", "Safety Manager",
+        "Estimator", "Foreman", "Construction Inspector", "Architect"
+    ),
+    "automotive": (
+        "Automotive Technician", "Service Manager", "Parts Manager",
+        "Automotive Engineer", "Quality Inspector", "Shop Foreman",
+        "Diagnostic Technician", "Body Shop Technician", "Service Advisor"
+    ),
+    "education": (
+        "Training Manager", "Instructional Designer", "Corporate Trainer",
+        "E-Learning Developer", "Curriculum Developer", "Adult Education Instructor",
+        "Training Coordinator", "Learning and Development Specialist"
+    ),
+    "sales": (
+        "Sales Representative", "Account Manager", "Sales Manager",
+        "Business Development Manager", "Inside Sales Rep", "Territory Manager",
+        "Customer Success Manager", "Sales Engineer", "Key Account Manager"
+    ),
+    "legal": (
+        "Compliance Officer", "Legal Counsel", "Paralegal", "Contract Manager",
+        "Regulatory Affairs Manager", "Privacy Officer", "Legal Assistant",
+        "Corporate Attorney", "Risk Manager"
+    ),
+    "environmental": (
+        "Environmental Specialist", "Sustainability Manager", "Environmental Consultant",
+        "Energy Manager", "Environmental Compliance Officer", "Waste Management Specialist",
+        "Carbon Manager", "Environmental Health & Safety Manager"
+    )
+}
+
+# Open-position count buckets (low, high) per role, with a power law across buckets
+ROLE_COUNT_BUCKETS = ((1, 5), (6, 20), (21, 50), (51, 100))
+ROLE_COUNT_BUCKET_CUM_WEIGHTS = tuple(accumulate((0.50, 0.35, 0.12, 0.03)))
+
 def generate_company_roles(domain: str) -> Dict[str, int]:
     """Generate realistic job roles and counts for a company in a specific domain."""
-    role_pools = {
-        "cs-it": [
-            "Software Engineer", "DevOps Engineer", "Cloud Architect", "Data Scientist",
-            "Security Engineer", "Full Stack Developer", "System Administrator",
-            "Database Administrator", "Network Engineer", "Product Manager", "IT Support"
-        ],
-        "cybersecurity": [
-            "Security Analyst", "Penetration Tester", "Security Engineer", "CISO",
-            "Incident Response Specialist", "Security Consultant", "Compliance Officer",
-            "Security Architect", "Threat Intelligence Analyst", "Forensics Specialist"
-        ],
-        "cloud-computing": [
-            "Cloud Architect", "DevOps Engineer", "Cloud Engineer", "Site Reliability Engineer",
-            "Cloud Security Specialist", "Platform Engineer", "Infrastructure Engineer",
-            "Cloud Consultant", "Solutions Architect", "Cloud Operations"
-        ],
-        "data-science": [
-            "Data Scientist", "Data Analyst", "Machine Learning Engineer", "Data Engineer",
-            "Business Intelligence Analyst", "Research Scientist", "Statistician",
-            "Data Architect", "Analytics Manager", "Quantitative Analyst"
-        ],
-        "artificial-intelligence": [
-            "AI Research Scientist", "Machine Learning Engineer", "Data Scientist",
-            "AI Product Manager", "Computer Vision Engineer", "NLP Engineer",
-            "AI Ethics Specialist", "Robotics Engineer", "AI Consultant"
-        ],
-        "software-development": [
-            "Software Engineer", "Frontend Developer", "Backend Developer", "Full Stack Developer",
-            "Mobile Developer", "QA Engineer", "Technical Lead", "Software Architect",
-            "Product Manager", "UX/UI Designer", "DevOps Engineer"
-        ],
-        "networking": [
-            "Network Engineer", "Network Administrator", "Network Architect",
-            "Wireless Engineer", "Network Security Specialist", "NOC Engineer",
-            "Infrastructure Engineer", "Telecommunications Specialist"
-        ],
-        "database-management": [
-            "Database Administrator", "Database Developer", "Data Engineer",
-            "Database Architect", "Performance Tuning Specialist", "Data Analyst",
-            "ETL Developer", "Database Security Specialist"
-        ],
-        "project-management": [
-            "Project Manager", "Program Manager", "Scrum Master", "Product Owner",
-            "PMO Director", "Project Coordinator", "Agile Coach", "Portfolio Manager",
-            "Business Analyst", "Change Manager"
-        ],
-        "business-analysis": [
-            "Business Analyst", "Systems Analyst", "Process Analyst", "Data Analyst",
-            "Requirements Analyst", "Product Manager", "Strategy Consultant",
-            "Operations Analyst", "Quality Analyst"
-        ],
-        "digital-marketing": [
-            "Digital Marketing Manager", "SEO Specialist", "PPC Specialist", "Content Manager",
-            "Social Media Manager", "Marketing Analyst", "Email Marketing Specialist",
-            "Growth Hacker", "Marketing Automation Specialist", "Brand Manager"
-        ],
-        "supply-chain": [
-            "Supply Chain Manager", "Logistics Coordinator", "Procurement Specialist",
-            "Operations Manager", "Demand Planner", "Supply Chain Analyst",
-            "Warehouse Manager", "Vendor Manager", "Transportation Manager"
-        ],
-        "human-resources": [
-            "HR Manager", "Recruiter", "HR Business Partner", "Compensation Analyst",
-            "Training Manager", "HR Coordinator", "Talent Acquisition Specialist",
-            "Employee Relations Specialist", "HR Generalist", "Benefits Administrator"
-        ],
-        "finance": [
-            "Financial Analyst", "Investment Advisor", "Risk Manager", "Portfolio Manager",
-            "Credit Analyst", "Financial Planner", "Quantitative Analyst",
-            "Investment Banker", "Treasury Analyst", "Compliance Officer"
-        ],
-        "accounting": [
-            "Staff Accountant", "Senior Accountant", "Tax Accountant", "Auditor",
-            "Controller", "Accounting Manager", "Cost Accountant", "Payroll Specialist",
-            "Accounts Payable Specialist", "Financial Reporting Analyst"
-        ],
-        "risk-management": [
-            "Risk Analyst", "Risk Manager", "Compliance Officer", "Operational Risk Specialist",
-            "Market Risk Analyst", "Credit Risk Analyst", "Risk Consultant",
-            "Regulatory Affairs Specialist", "Internal Auditor"
-        ],
-        "insurance": [
-            "Insurance Agent", "Underwriter", "Claims Adjuster", "Actuary",
-            "Insurance Broker", "Risk Assessor", "Claims Manager",
-            "Product Manager", "Compliance Specialist", "Account Manager"
-        ],
-        "healthcare": [
-            "Registered Nurse", "Medical Assistant", "Healthcare Administrator",
-            "Medical Coder", "Health Information Technician", "Case Manager",
-            "Clinical Coordinator", "Quality Assurance Specialist", "Patient Care Coordinator"
-        ],
-        "nursing": [
-            "Registered Nurse", "Licensed Practical Nurse", "Nurse Practitioner",
-            "Charge Nurse", "Clinical Nurse", "OR Nurse", "ICU Nurse",
-            "Emergency Room Nurse", "Pediatric Nurse", "Psychiatric Nurse"
-        ],
-        "pharmacy": [
-            "Pharmacist", "Pharmacy Technician", "Clinical Pharmacist",
-            "Hospital Pharmacist", "Retail Pharmacist", "Pharmacy Manager",
-            "Drug Safety Specialist", "Pharmaceutical Sales Rep"
-        ],
-        "medical-technology": [
-            "Medical Laboratory Technician", "Radiology Technician", "MRI Technologist",
-            "Ultrasound Technician", "Nuclear Medicine Technologist",
-            "Cardiovascular Technologist", "Medical Equipment Technician"
-        ],
-        "manufacturing": [
-            "Production Manager", "Manufacturing Engineer", "Quality Control Inspector",
-            "Plant Manager", "Production Supervisor", "Process Engineer",
-            "Maintenance Technician", "Safety Manager", "Lean Manufacturing Specialist"
-        ],
-        "quality-assurance": [
-            "Quality Engineer", "QA Manager", "Quality Control Inspector",
-            "Six Sigma Black Belt", "Quality Analyst", "Compliance Specialist",
-            "Process Improvement Specialist", "Quality Coordinator"
-        ],
-        "mechanical-engineering": [
-            "Mechanical Engineer", "Design Engineer", "Product Engineer",
-            "Manufacturing Engineer", "Project Engineer", "R&D Engineer",
-            "CAD Designer", "Test Engineer", "Field Service Engineer"
-        ],
-        "electrical-engineering": [
-            "Electrical Engineer", "Electronics Engineer", "Control Systems Engineer",
-            "Power Systems Engineer", "RF Engineer", "Hardware Engineer",
-            "Embedded Systems Engineer", "Test Engineer", "Field Engineer"
-        ],
-        "skilled-trades": [
-            "Electrician", "HVAC Technician", "Welder", "Carpenter", "Plumber",
-            "Maintenance Technician", "Industrial Mechanic", "Machinist",
-            "Pipefitter", "Sheet Metal Worker", "Instrumentation Technician"
-        ],
-        "construction": [
-            "Construction Manager", "Project Manager", "Site Supervisor",
-            "Construction Worker", "Equipment Operator", "Safety Manager",
-            "Estimator", "Foreman", "Construction Inspector", "Architect"
-        ],
-        "automotive": [
-            "Automotive Technician", "Service Manager", "Parts Manager",
-            "Automotive Engineer", "Quality Inspector", "Shop Foreman",
-            "Diagnostic Technician", "Body Shop Technician", "Service Advisor"
-        ],
-        "education": [
-            "Training Manager", "Instructional Designer", "Corporate Trainer",
-            "E-Learning Developer", "Curriculum Developer", "Adult Education Instructor",
-            "Training Coordinator", "Learning and Development Specialist"
-        ],
-        "sales": [
-            "Sales Representative", "Account Manager", "Sales Manager",
-            "Business Development Manager", "Inside Sales Rep", "Territory Manager",
-            "Customer Success Manager", "Sales Engineer", "Key Account Manager"
-        ],
-        "legal": [
-            "Compliance Officer", "Legal Counsel", "Paralegal", "Contract Manager",
-            "Regulatory Affairs Manager", "Privacy Officer", "Legal Assistant",
-            "Corporate Attorney", "Risk Manager"
-        ],
-        "environmental": [
-            "Environmental Specialist", "Sustainability Manager", "Environmental Consultant",
-            "Energy Manager", "Environmental Compliance Officer", "Waste Management Specialist",
-            "Carbon Manager", "Environmental Health & Safety Manager"
-        ]
-    }
-    
-    pool = role_pools.get(domain, role_pools["cs-it"])
+    pool = ROLE_POOLS.get(domain, ROLE_POOLS["cs-it"])
     num_roles = random.randint(4, 8)
     selected_roles = random.sample(pool, k=min(num_roles, len(pool)))
     
-    roles = {}
-    for role in selected_roles:
-        # Generate realistic job counts with power law distribution
-        count = random.choices(
-            [random.randint(1, 5), random.randint(6, 20), random.randint(21, 50), random.randint(51, 100)],
-            weights=[0.50, 0.35, 0.12, 0.03]
-        )[0]
-        roles[role] = count
-    
-    return roles
+    # Pick every role's bucket in one draw, then one count per role from its bucket
+    buckets = random.choices(ROLE_COUNT_BUCKETS, cum_weights=ROLE_COUNT_BUCKET_CUM_WEIGHTS, k=len(selected_roles))
+    randint = random.randint
+    return {role: randint(low, high) for role, (low, high) in zip(selected_roles, buckets)}
+
+# Industries a company in each domain may report, one picked per company
+INDUSTRY_MAP = {
+    "cs-it": ("Technology", "Software", "Information Technology", "Computer Services"),
+    "cybersecurity": ("Cybersecurity", "Information Security", "Technology", "Consulting"),
+    "cloud-computing": ("Cloud Services", "Technology", "Software", "Infrastructure"),
+    "data-science": ("Analytics", "Technology", "Consulting", "Research"),
+    "artificial-intelligence": ("AI Technology", "Machine Learning", "Technology", "Research"),
+    "software-development": ("Software Development", "Technology", "Digital Services"),
+    "networking": ("Telecommunications", "Technology", "Infrastructure", "Networking"),
+    "database-management": ("Database Technology", "Software", "Technology Services"),
+    "project-management": ("Consulting", "Management Services", "Technology", "Professional Services"),
+    "business-analysis": ("Consulting", "Business Services", "Analytics", "Professional Services"),
+    "digital-marketing": ("Digital Marketing", "Advertising", "Technology", "Media"),
+    "supply-chain": ("Logistics", "Supply Chain", "Transportation", "Manufacturing"),
+    "human-resources": ("Human Resources", "Staffing", "Consulting", "Professional Services"),
+    "finance": ("Financial Services", "Banking", "Investment Management", "Insurance"),
+    "accounting": ("Accounting", "Professional Services", "Consulting", "Financial Services"),
+    "risk-management": ("Risk Management", "Financial Services", "Insurance", "Consulting"),
+    "insurance": ("Insurance", "Financial Services", "Risk Management"),
+    "healthcare": ("Healthcare", "Medical Services", "Hospital Systems", "Health Technology"),
+    "nursing": ("Healthcare", "Hospital Systems", "Medical Services", "Long-term Care"),
+    "pharmacy": ("Pharmacy", "Healthcare", "Pharmaceuticals", "Retail"),
+    "medical-technology": ("Medical Technology", "Healthcare", "Medical Devices", "Diagnostics"),
+    "manufacturing": ("Manufacturing", "Industrial", "Production", "Automotive"),
+    "quality-assurance": ("Quality Assurance", "Manufacturing", "Consulting", "Testing Services"),
+    "mechanical-engineering": ("Engineering", "Manufacturing", "Automotive", "Aerospace"),
+    "electrical-engineering": ("Engineering", "Electronics", "Power & Energy", "Technology"),
+    "skilled-trades": ("Construction", "Manufacturing", "Maintenance Services", "Utilities"),
+    "construction": ("Construction", "Real Estate", "Engineering", "Infrastructure"),
+    "automotive": ("Automotive", "Transportation", "Manufacturing", "Repair Services"),
+    "education": ("Education", "Training", "Professional Development", "E-Learning"),
+    "sales": ("Sales", "Retail", "Business Development", "Professional Services"),
+    "legal": ("Legal Services", "Law Firms", "Compliance", "Professional Services"),
+    "environmental": ("Environmental Services", "Sustainability", "Energy", "Consulting")
+}
+DEFAULT_INDUSTRIES = ("Professional Services",)
 
 def get_industry_for_domain(domain: str) -> str:
     """Map domain to realistic industry."""
-    industry_map = {
-        "cs-it": random.choice(["Technology", "Software", "Information Technology", "Computer Services"]),
-        "cybersecurity": random.choice(["Cybersecurity", "Information Security", "Technology", "Consulting"]),
-        "cloud-computing": random.choice(["Cloud Services", "Technology", "Software", "Infrastructure"]),
-        "data-science": random.choice(["Analytics", "Technology", "Consulting", "Research"]),
-        "artificial-intelligence": random.choice(["AI Technology", "Machine Learning", "Technology", "Research"]),
-        "software-development": random.choice(["Software Development", "Technology", "Digital Services"]),
-        "networking": random.choice(["Telecommunications", "Technology", "Infrastructure", "Networking"]),
-        "database-management": random.choice(["Database Technology", "Software", "Technology Services"]),
-        "project-management": random.choice(["Consulting", "Management Services", "Technology", "Professional Services"]),
-        "business-analysis": random.choice(["Consulting", "Business Services", "Analytics", "Professional Services"]),
-        "digital-marketing": random.choice(["Digital Marketing", "Advertising", "Technology", "Media"]),
-        "supply-chain": random.choice(["Logistics", "Supply Chain", "Transportation", "Manufacturing"]),
-        "human-resources": random.choice(["Human Resources", "Staffing", "Consulting", "Professional Services"]),
-        "finance": random.choice(["Financial Services", "Banking", "Investment Management", "Insurance"]),
-        "accounting": random.choice(["Accounting", "Professional Services", "Consulting", "Financial Services"]),
-        "risk-management": random.choice(["Risk Management", "Financial Services", "Insurance", "Consulting"]),
-        "insurance": random.choice(["Insurance", "Financial Services", "Risk Management"]),
-        "healthcare": random.choice(["Healthcare", "Medical Services", "Hospital Systems", "Health Technology"]),
-        "nursing": random.choice(["Healthcare", "Hospital Systems", "Medical Services", "Long-term Care"]),
-        "pharmacy": random.choice(["Pharmacy", "Healthcare", "Pharmaceuticals", "Retail"]),
-        "medical-technology": random.choice(["Medical Technology", "Healthcare", "Medical Devices", "Diagnostics"]),
-        "manufacturing": random.choice(["Manufacturing", "Industrial", "Production", "Automotive"]),
-        "quality-assurance": random.choice(["Quality Assurance", "Manufacturing", "Consulting", "Testing Services"]),
-        "mechanical-engineering": random.choice(["Engineering", "Manufacturing", "Automotive", "Aerospace"]),
-        "electrical-engineering": random.choice(["Engineering", "Electronics", "Power & Energy", "Technology"]),
-        "skilled-trades": random.choice(["Construction", "Manufacturing", "Maintenance Services", "Utilities"]),
-        "construction": random.choice(["Construction", "Real Estate", "Engineering", "Infrastructure"]),
-        "automotive": random.choice(["Automotive", "Transportation", "Manufacturing", "Repair Services"]),
-        "education": random.choice(["Education", "Training", "Professional Development", "E-Learning"]),
-        "sales": random.choice(["Sales", "Retail", "Business Development", "Professional Services"]),
-        "legal": random.choice(["Legal Services", "Law Firms", "Compliance", "Professional Services"]),
-        "environmental": random.choice(["Environmental Services", "Sustainability", "Energy", "Consulting"])
-    }
-    return industry_map.get(domain, "Professional Services")
+    return random.choice(INDUSTRY_MAP.get(domain, DEFAULT_INDUSTRIES))
 
-def generate_company_recommendations(certifications: List[Dict], companies: List[Dict]) -> Dict:
-    """Generate certification recommendations for each company."""
-    recommendations = {}
-    
-    for domain in DOMAINS.keys():
-        recommendations[domain] = {}
-        domain_companies = [c for c in companies if c["primary_domain"] == domain]
-        domain_certifications = [c for c in certifications if c["domain"] == domain]
-        
-        for company in domain_companies:
-            company_recs = []
+def _json_default(obj: Any) -> Dict:
+    """Let the stdlib encoder write Certification and Company records as plain JSON objects."""
+    if isinstance(obj, (Certification, Company)):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def dumps_json(data: Any, compact: bool = False) -> bytes:
+    """Serialize data to UTF-8 bytes with the same layout save_json_data writes.
+
+    Output is indented by 2 spaces, or has no whitespace at all when ``compact`` is set.
+    """
+    if orjson is not None:
+        return orjson.dumps(data) if compact else orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    if compact:
+        return json.dumps(data, separators=(',', ':'), ensure_ascii=False, default=_json_default).encode('utf-8')
+    return json.dumps(data, indent=2, ensure_ascii=False, default=_json_default).encode('utf-8')
+
+# Uniform mention counts, drawn a company at a time via random.choices
+MENTION_COUNT_RANGE = range(0, 36)
+
+def sample_from_pool(pool: List[Any], k: int, rng: random.Random) -> List[Any]:
+    """Draw k distinct items by partially shuffling ``pool`` in place, then undoing the swaps.
+
+    Restoring the order keeps each draw independent of earlier ones, so one copy per
+    population can serve every draw instead of random.sample copying the population each
+    call. Indices are scaled from rng.random() the same way unweighted random.choices picks them.
+    """
+    rand = rng.random
+    n = len(pool)
+    swaps = []
+    for i in range(k):
+        j = i + int(rand() * (n - i))
+        pool[i], pool[j] = pool[j], pool[i]
+        swaps.append(j)
+    picked = pool[:k]
+    for i in range(k - 1, -1, -1):
+        j = swaps[i]
+        pool[i], pool[j] = pool[j], pool[i]
+    return picked
+
+def generate_and_stream_recommendations(
+    certs_by_domain: Dict[str, List[Certification]],
+    companies_by_domain: Dict[str, List[Company]],
+    out_path: Path
+) -> int:
+    """Generate certification recommendations and stream them to disk company by company.
+
+    The output keeps the nested ``{domain: {company_slug: [recs]}}`` layout of
+    ``recommendations.json``, but each company's list is serialized and written as
+    soon as it is computed so peak memory no longer grows with the company count.
+    Returns the number of companies written.
+    """
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    written = 0
+    
+    with open(out_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(b"{")
+        for d_index, domain in enumerate(DOMAINS.keys()):
+            domain_companies = companies_by_domain.get(domain, [])
+            domain_certifications = certs_by_domain.get(domain, [])
+            cert_pool = list(domain_certifications)  # Reused by every company in the domain
             
-            # Select top certifications for this company (more realistic number)
-            num_recommendations = min(random.randint(8, 25), len(domain_certifications))
-            selected_certs = random.sample(domain_certifications, k=num_recommendations)
+            f.write(b",\n  " if d_index else b"\n  ")
+            f.write(dumps_json(domain) + b": {")
             
-            for cert in selected_certs:
-                # Generate realistic fit scores and signals
-                role_alignment = random.uniform(0.1, 0.95)
-                issuer_affinity = random.uniform(0.05, 0.85)
-                global_rank_norm = random.uniform(0.2, 1.0)
-                cost_penalty = random.uniform(0.0, 0.20)
+            for c_index, company in enumerate(domain_companies):
+                # Every draw for this company comes from its own generator, seeded by its slug
+                # (str seeds hash stably across runs), with the hot methods bound to locals
+                rng = random.Random(company.slug)
+                rand = rng.random
                 
-                fit_score = (
-                    role_alignment * 0.4 + 
-                    issuer_affinity * 0.3 + 
-                    global_rank_norm * 0.3
-                ) - cost_penalty
-                fit_score = max(0.05, min(1.0, fit_score))
+                # Select top certifications for this company (more realistic number)
+                num_recommendations = min(rng.randint(8, 25), len(domain_certifications))
+                selected_certs = sample_from_pool(cert_pool, num_recommendations, rng)
                 
-                recommendation = {
-                    "slug": cert["slug"],
-                    "fit_score": round(fit_score, 3),
-                    "signals": {
-                        "role_alignment": round(role_alignment, 3),
-                        "issuer_affinity": round(issuer_affinity, 3),
-                        "global_rank_norm": round(global_rank_norm, 3),
-                        "cost_penalty": round(cost_penalty, 3),
-                        "mention_count": random.randint(0, 35),
-                        "mention_z": round(random.uniform(-1.5, 3.5), 2)
+                # Draw each signal as a column for the whole company rather than per recommendation.
+                # random.uniform(a, b) is spelled out as a + (b - a) * random() (same values, and the
+                # constant spans fold at compile time) to skip a Python-level call per draw.
+                picks = range(num_recommendations)
+                role_alignments = [0.1 + (0.95 - 0.1) * rand() for _ in picks]
+                issuer_affinities = [0.05 + (0.85 - 0.05) * rand() for _ in picks]
+                global_rank_norms = [0.2 + (1.0 - 0.2) * rand() for _ in picks]
+                cost_penalties = [0.0 + (0.20 - 0.0) * rand() for _ in picks]
+                mention_counts = rng.choices(MENTION_COUNT_RANGE, k=num_recommendations)
+                mention_zs = [-1.5 + (3.5 - -1.5) * rand() for _ in picks]
+                
+                fit_scores = [
+                    round(max(0.05, min(1.0, (
+                        role_alignment * 0.4 + 
+                        issuer_affinity * 0.3 + 
+                        global_rank_norm * 0.3
+                    ) - cost_penalty)), 3)
+                    for role_alignment, issuer_affinity, global_rank_norm, cost_penalty in zip(
+                        role_alignments, issuer_affinities, global_rank_norms, cost_penalties
+                    )
+                ]
+                
+                # Sort by fit score, then build the records in that order
+                order = sorted(picks, key=fit_scores.__getitem__, reverse=True)
+                company_recs = [
+                    {
+                        "slug": selected_certs[i].slug,
+                        "fit_score": fit_scores[i],
+                        "signals": {
+                            "role_alignment": round(role_alignments[i], 3),
+                            "issuer_affinity": round(issuer_affinities[i], 3),
+                            "global_rank_norm": round(global_rank_norms[i], 3),
+                            "cost_penalty": round(cost_penalties[i], 3),
+                            "mention_count": mention_counts[i],
+                            "mention_z": round(mention_zs[i], 2)
+                        }
                     }
-                }
-                company_recs.append(recommendation)
+                    for i in order
+                ]
+                
+                # Emit this company's entry at the same indentation save_json_data would use
+                recs_json = dumps_json(company_recs).replace(b"\n", b"\n    ")
+                f.write(b",\n    " if c_index else b"\n    ")
+                f.write(dumps_json(company.slug) + b": " + recs_json)
+                written += 1
             
-            # Sort by fit score
-            company_recs.sort(key=lambda x: x["fit_score"], reverse=True)
-            recommendations[domain][company["slug"]] = company_recs
+            f.write(b"\n  }" if domain_companies else b"}")
+        f.write(b"\n}")
     
-    return recommendations
+    print(f"✅ Saved {out_path}")
+    return written
+
+# Daily ranking movement: trend direction weights and the uniform rank change range
+TREND_DIRECTIONS = ("up", "down", "stable")
+TREND_CUM_WEIGHTS = tuple(accumulate((0.3, 0.2, 0.5)))
+RANK_CHANGE_RANGE = range(-8, 9)
 
-def generate_rankings_data(certifications: List[Dict]) -> Dict:
-    """Generate ranking data for today and trends."""
+def generate_rankings_data(
+    certifications: List[Certification],
+    certs_by_domain: Dict[str, List[Certification]],
+    domain_avg_salaries: Dict[str, float]
+) -> Dict:
+    """Generate ranking data for today and trends.
+
+    ``certs_by_domain`` lists are expected in global ranking order, as grouped from
+    the ranked output of generate_certifications.
+    """
     today_rankings = []
     
     for domain in DOMAINS.keys():
-        domain_certs = [c for c in certifications if c["domain"] == domain]
-        # Sort by ranking (already computed)
-        domain_certs.sort(key=lambda x: x["ranking"])
+        top_certs = certs_by_domain.get(domain, [])[:30]  # Top 30 per domain
+        
+        # Draw the domain's trend directions and rank changes in one call each
+        trend_picks = random.choices(TREND_DIRECTIONS, cum_weights=TREND_CUM_WEIGHTS, k=len(top_certs))
+        rank_changes = random.choices(RANK_CHANGE_RANGE, k=len(top_certs))
         
-        for rank_in_domain, cert in enumerate(domain_certs[:30], 1):  # Top 30 per domain
+        for rank_in_domain, (cert, trend, change) in enumerate(zip(top_certs, trend_picks, rank_changes), 1):
             today_rankings.append({
                 "rank": rank_in_domain,
-                "global_rank": cert["ranking"],
-                "slug": cert["slug"],
-                "name": cert["name"],
-                "issuer": cert["issuer"],
+                "global_rank": cert.ranking,
+                "slug": cert.slug,
+                "name": cert.name,
+                "issuer": cert.issuer,
                 "domain": domain,
-                "rating": cert["rating"],
-                "job_postings": cert["job_postings"],
-                "trend": random.choices(["up", "down", "stable"], weights=[0.3, 0.2, 0.5])[0],
-                "change": random.randint(-8, 8)
+                "rating": cert.rating,
+                "job_postings": cert.job_postings,
+                "trend": trend,
+                "change": change
             })
     
     # Generate trend data
@@ -1534,7 +1791,7 @@ def generate_rankings_data(certifications: List[Dict]) -> Dict:
                 "data-science", "digital-marketing"
             ],
             "declining_domains": ["skilled-trades"],
-            "hot_certifications": [r["slug"] for r in sorted(today_rankings, key=lambda x: x["global_rank"])[:20]],
+            "hot_certifications": [r["slug"] for r in nsmallest(20, today_rankings, key=itemgetter("global_rank"))],
             "emerging_skills": [
                 "Artificial Intelligence", "Machine Learning", "Cloud Security", 
                 "Data Analytics", "DevOps", "Kubernetes", "Blockchain",
@@ -1542,7 +1799,7 @@ def generate_rankings_data(certifications: List[Dict]) -> Dict:
             ],
             "fastest_growing_issuers": ["AWS", "Microsoft", "Google Cloud", "Salesforce", "CompTIA"],
             "market_insights": {
-                "total_job_postings": sum(cert["job_postings"] for cert in certifications),
+                "total_job_postings": sum(cert.job_postings for cert in certifications),
                 "avg_salary_increase": 8.5,
                 "new_certifications_this_year": 45,
                 "retirement_rate": 12
@@ -1551,9 +1808,8 @@ def generate_rankings_data(certifications: List[Dict]) -> Dict:
         "by_domain": {
             domain: {
                 "growth_rate": random.uniform(-5.0, 25.0),
-                "avg_salary": sum(c["salary"]["avg"] for c in certifications if c["domain"] == domain) / 
-                             len([c for c in certifications if c["domain"] == domain]),
-                "top_skills": generate_skills(domain)[:5]
+                "avg_salary": domain_avg_salaries[domain],
+                "top_skills": generate_top_skills(domain)
             }
             for domain in DOMAINS.keys()
         }
@@ -1564,12 +1820,20 @@ def generate_rankings_data(certifications: List[Dict]) -> Dict:
         "trends": trends
     }
 
-def save_json_data(data: Any, filepath: Path) -> None:
-    """Save data as JSON with pretty formatting."""
+def save_json_data(data: Any, filepath: Path, compact: bool = False, gzip_copy: bool = False) -> None:
+    """Save data as JSON with pretty formatting (or compact, for files the frontend downloads).
+
+    With ``gzip_copy`` a pre-compressed ``.json.gz`` is written next to the file as well.
+    """
     filepath.parent.mkdir(parents=True, exist_ok=True)
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    print(f"✅ Saved {filepath} ({len(str(data))} characters)")
+    payload = dumps_json(data, compact=compact)
+    filepath.write_bytes(payload)
+    print(f"✅ Saved {filepath} ({len(payload):,} bytes)")
+    if gzip_copy:
+        gzip_path = filepath.with_name(filepath.name + ".gz")
+        compressed = gzip.compress(payload, compresslevel=6, mtime=0)  # mtime=0 keeps rebuilds byte-identical
+        gzip_path.write_bytes(compressed)
+        print(f"✅ Saved {gzip_path} ({len(compressed):,} bytes)")
 
 def main():
     """Generate massive certification platform data."""
@@ -1583,51 +1847,73 @@ def main():
     certifications = generate_certifications()
     print(f"✅ Generated {len(certifications)} certifications")
     
+    # Index certifications once (in ranking order) and tally per-domain / per-issuer sums in the same pass;
+    # everything below reads these instead of rescanning
+    certs_by_domain = defaultdict(list)
+    certs_by_issuer = defaultdict(list)
+    domain_totals = defaultdict(lambda: {"rating": 0, "cost": 0, "salary": 0})
+    issuer_totals = defaultdict(lambda: {"rating": 0, "cost": 0})
+    issuer_domains = defaultdict(set)
+    for cert in certifications:
+        domain = cert.domain
+        certs_by_domain[domain].append(cert)
+        totals = domain_totals[domain]
+        totals["rating"] += cert.rating
+        totals["cost"] += cert.cost
+        totals["salary"] += cert.salary["avg"]
+        
+        issuer = cert.issuer
+        certs_by_issuer[issuer].append(cert)
+        issuer_domains[issuer].add(domain)
+        totals = issuer_totals[issuer]
+        totals["rating"] += cert.rating
+        totals["cost"] += cert.cost
+    
+    # Freeze the indexes so later lookups of missing keys cannot insert into them
+    certs_by_domain = dict(certs_by_domain)
+    certs_by_issuer = dict(certs_by_issuer)
+    
+    domain_avg_salaries = {
+        domain: totals["salary"] / len(certs_by_domain[domain])
+        for domain, totals in domain_totals.items()
+    }
+    
     print("🏢 Generating companies...")
     companies = generate_companies()
     print(f"✅ Generated {len(companies)} companies")
     
+    companies_by_domain = defaultdict(list)
+    for company in companies:
+        companies_by_domain[company.primary_domain].append(company)
+    companies_by_domain = dict(companies_by_domain)
+    
     print("🎯 Generating company recommendations...")
-    recommendations = generate_company_recommendations(certifications, companies)
+    generate_and_stream_recommendations(certs_by_domain, companies_by_domain, OUTPUT_DIR / "companies/recommendations.json")
     print("✅ Generated company recommendations")
     
     print("📈 Generating rankings...")
-    rankings_data = generate_rankings_data(certifications)
+    rankings_data = generate_rankings_data(certifications, certs_by_domain, domain_avg_salaries)
     print("✅ Generated rankings and trends")
     
     # Save all data
     print("\n💾 Saving data files...")
     
     # Certifications by domain (for sharded service)
-    certs_by_domain = {}
-    for cert in certifications:
-        domain = cert["domain"]
-        if domain not in certs_by_domain:
-            certs_by_domain[domain] = []
-        certs_by_domain[domain].append(cert)
-    
     for domain, certs in certs_by_domain.items():
         save_json_data(certs, OUTPUT_DIR / f"certifications/{domain}.json")
     
     # Companies data
-    companies_by_domain = {}
-    for company in companies:
-        domain = company["primary_domain"]
-        if domain not in companies_by_domain:
-            companies_by_domain[domain] = []
-        companies_by_domain[domain].append(company)
-    
     save_json_data(companies_by_domain, OUTPUT_DIR / "companies/by_domain.json")
-    save_json_data(recommendations, OUTPUT_DIR / "companies/recommendations.json")
     
-    # Rankings
-    save_json_data(rankings_data["today"], OUTPUT_DIR / "rankings/today.json")
-    save_json_data(rankings_data["trends"], OUTPUT_DIR / "rankings/trends.json")
+    # Rankings (downloaded as-is by the frontend, so written compact)
+    save_json_data(rankings_data["today"], OUTPUT_DIR / "rankings/today.json", compact=True, gzip_copy=WRITE_GZIP_COPIES)
+    save_json_data(rankings_data["trends"], OUTPUT_DIR / "rankings/trends.json", compact=True, gzip_copy=WRITE_GZIP_COPIES)
     
-    # Generate manifest
+    # Generate manifest (one timestamp shared by the manifest and all shards)
+    generated_at = datetime.now().isoformat()
     manifest = {
         "version": "3.0.0",
-        "generated_at": datetime.now().isoformat(),
+        "generated_at": generated_at,
         "stats": {
             "total_certifications": len(certifications),
             "total_companies": len(companies),
@@ -1640,10 +1926,10 @@ def main():
             domain: {
                 "file": f"certifications/{domain}.json",
                 "count": len(certs),
-                "last_updated": datetime.now().isoformat(),
-                "avg_rating": round(sum(c["rating"] for c in certs) / len(certs), 2),
-                "avg_cost": round(sum(c["cost"] for c in certs) / len(certs), 0),
-                "top_issuers": list(set([c["issuer"] for c in certs[:5]]))
+                "last_updated": generated_at,
+                "avg_rating": round(domain_totals[domain]["rating"] / len(certs), 2),
+                "avg_cost": round(domain_totals[domain]["cost"] / len(certs), 0),
+                "top_issuers": list({c.issuer for c in certs[:5]})
             }
             for domain, certs in certs_by_domain.items()
         },
@@ -1652,9 +1938,8 @@ def main():
                 "label": info["label"],
                 "emoji": info["emoji"],
                 "certification_count": len(certs_by_domain.get(domain, [])),
-                "company_count": len([c for c in companies if c["primary_domain"] == domain]),
-                "avg_salary": round(sum(c["salary"]["avg"] for c in certifications if c["domain"] == domain) / 
-                                 len([c for c in certifications if c["domain"] == domain]), 0),
+                "company_count": len(companies_by_domain.get(domain, [])),
+                "avg_salary": round(domain_avg_salaries[domain], 0),
                 "job_market_strength": random.choice(["Strong", "Growing", "Moderate", "Emerging"])
             }
             for domain, info in DOMAINS.items()
@@ -1666,16 +1951,14 @@ def main():
     analytics = {
         "issuer_stats": {
             issuer: {
-                "certification_count": len([c for c in certifications if c["issuer"] == issuer]),
-                "avg_rating": round(sum(c["rating"] for c in certifications if c["issuer"] == issuer) / 
-                                 max(1, len([c for c in certifications if c["issuer"] == issuer])), 2),
-                "avg_cost": round(sum(c["cost"] for c in certifications if c["issuer"] == issuer) / 
-                                max(1, len([c for c in certifications if c["issuer"] == issuer])), 0),
-                "domains": list(set([c["domain"] for c in certifications if c["issuer"] == issuer])),
+                "certification_count": len(certs_by_issuer[issuer]),
+                "avg_rating": round(issuer_totals[issuer]["rating"] / len(certs_by_issuer[issuer]), 2),
+                "avg_cost": round(issuer_totals[issuer]["cost"] / len(certs_by_issuer[issuer]), 0),
+                "domains": list(issuer_domains[issuer]),
                 "popularity_score": ISSUERS[issuer]["popularity"]
             }
             for issuer in ISSUERS.keys()
-            if any(c["issuer"] == issuer for c in certifications)
+            if issuer in certs_by_issuer
         },
         "skill_analysis": {
             "most_common_skills": {},
@@ -1698,33 +1981,34 @@ def main():
     print(f"   • {len(rankings_data['today']):,} ranking entries")
     print(f"   • Complete company-specific certification recommendations")
     
-    domain_counts = {domain: len([c for c in certifications if c["domain"] == domain]) for domain in DOMAINS}
+    domain_counts = {domain: len(certs_by_domain.get(domain, [])) for domain in DOMAINS}
     print(f"\n📊 Certifications by Domain:")
     for domain, count in sorted(domain_counts.items(), key=lambda x: x[1], reverse=True):
         percentage = (count / len(certifications)) * 100
         print(f"   • {DOMAINS[domain]['emoji']} {DOMAINS[domain]['label']}: {count:,} ({percentage:.1f}%)")
     
     print(f"\n🎯 Top Issuers by Certification Count:")
-    issuer_counts = {}
-    for cert in certifications:
-        issuer_counts[cert["issuer"]] = issuer_counts.get(cert["issuer"], 0) + 1
+    issuer_counts = {issuer: len(certs) for issuer, certs in certs_by_issuer.items()}
     
     for issuer, count in sorted(issuer_counts.items(), key=lambda x: x[1], reverse=True)[:10]:
         print(f"   • {issuer}: {count} certifications")
     
     print(f"\n💰 Average Costs by Domain:")
     for domain in sorted(DOMAINS.keys()):
-        domain_certs = [c for c in certifications if c["domain"] == domain]
-        if domain_certs:
-            avg_cost = sum(c["cost"] for c in domain_certs) / len(domain_certs)
+        if domain in domain_totals:
+            avg_cost = domain_totals[domain]["cost"] / len(certs_by_domain[domain])
             print(f"   • {DOMAINS[domain]['emoji']} {DOMAINS[domain]['label']}: ${avg_cost:,.0f}")
     
+    unique_skills = set()
+    for cert in certifications:
+        unique_skills.update(cert.skills)
+    
     print(f"\n📈 Data Quality Metrics:")
-    print(f"   • Average rating: {sum(c['rating'] for c in certifications) / len(certifications):.2f}/5.0")
-    print(f"   • Total job postings tracked: {sum(c['job_postings'] for c in certifications):,}")
-    print(f"   • Skills coverage: {len(set(skill for c in certifications for skill in c['skills']))} unique skills")
-    print(f"   • Certification levels: {len(set(c['level'] for c in certifications))} different levels")
-    print(f"   • Industry coverage: {len(set(c['industry'] for c in companies))} industries")
+    print(f"   • Average rating: {sum(c.rating for c in certifications) / len(certifications):.2f}/5.0")
+    print(f"   • Total job postings tracked: {sum(c.job_postings for c in certifications):,}")
+    print(f"   • Skills coverage: {len(unique_skills)} unique skills")
+    print(f"   • Certification levels: {len({c.level for c in certifications})} different levels")
+    print(f"   • Industry coverage: {len({c.industry for c in companies})} industries")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -7,22 +7,51 @@ Creates a lightweight JSONL index optimized for fuzzy search
 import os
 import json
 import pathlib
-from typing import Dict, List, Any
+from typing import Dict, Any, Iterable, Iterator
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 DATA_DIR = ROOT / "web" / "public" / "data"
+JSONL_FLUSH_ITEMS = 10_000  # Lines buffered per write, bounding memory on large indexes
 
 def load_json(path: pathlib.Path) -> Any:
     """Load JSON file"""
     with open(path, "r", encoding="utf-8") as f:
         return json.load(f)
 
-def save_jsonl(path: pathlib.Path, items: List[Dict]) -> None:
-    """Save items as JSONL (one JSON object per line)"""
+def dumps_jsonl_line(item: Dict) -> bytes:
+    """Encode one item as a compact UTF-8 JSON line, identical with or without orjson"""
+    if orjson is not None:
+        return orjson.dumps(item, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(item, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+def save_jsonl(path: pathlib.Path, items: Iterable[Dict]) -> int:
+    """Save items as JSONL (one JSON object per line), consuming them as they come; returns the line count
+
+    Lines go to a sibling temp file that replaces ``path`` only once every item is written,
+    so a failure while producing items leaves the previous file in place.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        for item in items:
-            f.write(json.dumps(item, ensure_ascii=False) + "\n")
+    tmp_path = path.with_name(path.name + ".tmp")
+    count = 0
+    try:
+        with open(tmp_path, "wb") as f:
+            buffer = bytearray()
+            for count, item in enumerate(items, 1):
+                buffer += dumps_jsonl_line(item)
+                if count % JSONL_FLUSH_ITEMS == 0:
+                    f.write(buffer)
+                    buffer.clear()
+            f.write(buffer)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return count
 
 def create_search_index_item(cert: Dict) -> Dict:
     """Create optimized search index item"""
@@ -36,54 +65,54 @@ def create_search_index_item(cert: Dict) -> Dict:
         "keywords": cert.get("keywords", [])
     }
 
-def generate_search_index():
-    """Generate optimized search index for Fuse.js"""
-    print("🔍 Building search index...")
-    
-    # Load certifications from shards or legacy format
-    certs_data = []
+def iter_certifications() -> Iterator[Dict]:
+    """Yield certifications from shards or legacy format, holding one file in memory at a time"""
     map_path = DATA_DIR / "certifications" / "index.map.json"
     
     if map_path.exists():
         # Load from shards
         shard_map = load_json(map_path)
         for shard in shard_map.get("shards", []):
-            shard_file = shard["file"].replace("/data/", "")
+            shard_file = shard.get("rel_path") or shard["file"].replace("/data/", "")
             shard_path = DATA_DIR / shard_file
             if shard_path.exists():
-                certs_data.extend(load_json(shard_path))
+                yield from load_json(shard_path)
                 print(f"   📄 Loaded shard: {shard_file}")
     else:
         # Load from legacy file
         index_path = DATA_DIR / "certifications" / "index.json"
         if index_path.exists():
-            certs_data = load_json(index_path)
+            yield from load_json(index_path)
             print(f"   📄 Loaded legacy format: index.json")
+
+def generate_search_index():
+    """Generate optimized search index for Fuse.js"""
+    print("🔍 Building search index...")
     
-    # Create search index items
-    search_items = []
-    for cert in certs_data:
-        search_item = create_search_index_item(cert)
-        search_items.append(search_item)
-    
-    # Save as JSONL for efficient streaming loading
+    # Create search index items as certifications stream in, and save as JSONL for efficient streaming loading
     search_index_path = DATA_DIR / "search" / "index.jsonl"
-    save_jsonl(search_index_path, search_items)
+    total_items = save_jsonl(
+        search_index_path,
+        (create_search_index_item(cert) for cert in iter_certifications())
+    )
     
     # Generate search index metadata
     metadata = {
-        "total_items": len(search_items),
+        "total_items": total_items,
         "generated_at": "2024-01-01T00:00:00Z",  # Placeholder
         "format": "jsonl",
         "version": "1.0"
     }
     
     metadata_path = DATA_DIR / "search" / "metadata.json"
-    with open(metadata_path, "w", encoding="utf-8") as f:
-        json.dump(metadata, f, ensure_ascii=False, indent=2)
+    if orjson is not None:
+        metadata_path.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+    else:
+        with open(metadata_path, "w", encoding="utf-8") as f:
+            json.dump(metadata, f, ensure_ascii=False, indent=2)
     
     print(f"🎉 Search index complete!")
-    print(f"   📊 Indexed {len(search_items)} certifications")
+    print(f"   📊 Indexed {total_items} certifications")
     print(f"   💾 Size: {search_index_path.stat().st_size / 1024:.1f}KB")
     print(f"   📍 Location: {search_index_path.relative_to(ROOT)}")
 
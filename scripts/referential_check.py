@@ -5,47 +5,51 @@ Ensures all cross-file references are valid
 """
 
 import json
+import mmap
+import os
 import pathlib
 import sys
-from typing import Set, List, Dict, Any
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import FrozenSet, List, Dict, Any, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 DATA_DIR = ROOT / "web" / "public" / "data"
+MMAP_MIN_BYTES = 256 * 1024  # Smaller files are cheaper to read into memory
+
+get_slug = itemgetter("slug")
+SHARD_LOAD_WORKERS = 8
 
 def load_json(path: pathlib.Path) -> Any:
-    """Load JSON file"""
+    """Load JSON file; large files are parsed straight from a read-only mmap"""
+    if orjson is not None:
+        if path.stat().st_size > MMAP_MIN_BYTES:
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    return orjson.loads(view)
+        return orjson.loads(path.read_bytes())
     with open(path, "r", encoding="utf-8") as f:
         return json.load(f)
 
-def get_all_certification_slugs() -> Set[str]:
-    """Get all certification slugs from either sharded or legacy files"""
-    slugs = set()
-    
-    # Check if sharding is enabled
-    map_path = DATA_DIR / "certifications" / "index.map.json"
-    
-    if map_path.exists():
-        # Load from shards
-        shard_map = load_json(map_path)
-        for shard in shard_map.get("shards", []):
-            shard_file = shard["file"].replace("/data/", "")
-            shard_path = DATA_DIR / shard_file
-            
-            if shard_path.exists():
-                certs = load_json(shard_path)
-                for cert in certs:
-                    slugs.add(cert["slug"])
-    else:
-        # Load from legacy file
-        index_path = DATA_DIR / "certifications" / "index.json"
-        if index_path.exists():
-            certs = load_json(index_path)
-            for cert in certs:
-                slugs.add(cert["slug"])
-    
-    return slugs
+def load_shard(path: pathlib.Path) -> Optional[List[Dict[str, Any]]]:
+    """Load one shard, or None when the file is missing"""
+    return load_json(path) if path.exists() else None
 
-def check_rankings_references(cert_slugs: Set[str]) -> List[str]:
+def load_shards(shard_map: Dict[str, Any]) -> List[Tuple[Dict[str, Any], pathlib.Path, Any]]:
+    """Load every shard in the map concurrently, returning (shard entry, path, certs) in map order"""
+    shards = shard_map.get("shards", [])
+    shard_paths = [DATA_DIR / (shard.get("rel_path") or shard["file"].replace("/data/", "")) for shard in shards]
+    with ThreadPoolExecutor(max_workers=SHARD_LOAD_WORKERS) as executor:
+        contents = list(executor.map(load_shard, shard_paths))
+    return list(zip(shards, shard_paths, contents))
+
+def check_rankings_references(cert_slugs: FrozenSet[str]) -> List[str]:
     """Check that all ranking references point to valid certifications"""
     errors = []
     
@@ -53,22 +57,26 @@ def check_rankings_references(cert_slugs: Set[str]) -> List[str]:
     today_path = DATA_DIR / "rankings" / "today.json"
     if today_path.exists():
         rankings = load_json(today_path)
-        for ranking in rankings:
-            slug = ranking.get("slug")
-            if slug and slug not in cert_slugs:
-                errors.append(f"rankings/today.json: Invalid slug reference '{slug}'")
+        ranked_slugs = [slug for slug in (ranking.get("slug") for ranking in rankings) if slug]
+        invalid = set(ranked_slugs) - cert_slugs
+        if invalid:
+            for slug in ranked_slugs:
+                if slug in invalid:
+                    errors.append(f"rankings/today.json: Invalid slug reference '{slug}'")
     
     # Check trends
     trends_path = DATA_DIR / "rankings" / "trends.json"
     if trends_path.exists():
         trends = load_json(trends_path)
-        for slug in trends.keys():
-            if slug not in cert_slugs:
-                errors.append(f"rankings/trends.json: Invalid slug reference '{slug}'")
+        invalid = trends.keys() - cert_slugs
+        if invalid:
+            for slug in trends:
+                if slug in invalid:
+                    errors.append(f"rankings/trends.json: Invalid slug reference '{slug}'")
     
     return errors
 
-def check_company_references(cert_slugs: Set[str]) -> List[str]:
+def check_company_references(cert_slugs: FrozenSet[str]) -> List[str]:
     """Check that all company recommendation references point to valid certifications"""
     errors = []
     
@@ -76,15 +84,26 @@ def check_company_references(cert_slugs: Set[str]) -> List[str]:
     if recommendations_path.exists():
         recommendations = load_json(recommendations_path)
         
-        for domain, companies in recommendations.items():
-            for company_slug, recs in companies.items():
-                for i, rec in enumerate(recs):
-                    slug = rec.get("slug")
-                    if slug and slug not in cert_slugs:
-                        errors.append(
-                            f"companies/recommendations.json: Invalid slug reference '{slug}' "
-                            f"in {domain} > {company_slug} > recommendation {i+1}"
-                        )
+        # Collect only the referenced slugs so invalid ones are found with one set difference
+        get = dict.get
+        referenced = {
+            get(rec, "slug")
+            for companies in recommendations.values()
+            for recs in companies.values()
+            for rec in recs
+        }
+        invalid = referenced - cert_slugs - {None, ""}
+        if invalid:
+            # Walk the recommendations again only to locate the invalid references
+            for domain, companies in recommendations.items():
+                for company_slug, recs in companies.items():
+                    for i, rec in enumerate(recs):
+                        slug = get(rec, "slug")
+                        if slug in invalid:
+                            errors.append(
+                                f"companies/recommendations.json: Invalid slug reference '{slug}' "
+                                f"in {domain} > {company_slug} > recommendation {i+1}"
+                            )
     
     return errors
 
@@ -96,102 +115,100 @@ def check_manifest_references() -> List[str]:
     if manifest_path.exists():
         manifest = load_json(manifest_path)
         
-        for file_key, file_path in manifest.get("files", {}).items():
-            # Convert web path to filesystem path
-            fs_path = DATA_DIR / file_path.replace("/data/", "")
-            
-            if not fs_path.exists():
+        # Convert web paths to filesystem paths
+        referenced = [
+            (file_path, DATA_DIR / file_path.replace("/data/", ""))
+            for file_path in manifest.get("files", {}).values()
+        ]
+        
+        # List each referenced directory once instead of stat-ing every file
+        existing_by_dir = {}
+        for _, fs_path in referenced:
+            if fs_path.parent not in existing_by_dir:
+                try:
+                    with os.scandir(fs_path.parent) as entries:
+                        existing_by_dir[fs_path.parent] = {entry.name for entry in entries}
+                except OSError:
+                    existing_by_dir[fs_path.parent] = set()
+        
+        for file_path, fs_path in referenced:
+            if fs_path.name not in existing_by_dir[fs_path.parent]:
                 errors.append(f"manifest.json: Referenced file does not exist: {file_path}")
     
     return errors
 
-def check_shard_integrity() -> List[str]:
-    """Check shard map integrity if sharding is enabled"""
+def check_shard_entry(shard: Dict[str, Any], shard_path: pathlib.Path, actual_count: int) -> List[str]:
+    """Check one shard's reported count and size against the file"""
     errors = []
     
-    map_path = DATA_DIR / "certifications" / "index.map.json"
-    if not map_path.exists():
-        return errors  # Sharding not enabled
+    # Check actual count matches reported count
+    reported_count = shard.get("count", 0)
     
-    try:
-        shard_map = load_json(map_path)
-        total_count = 0
-        
-        for shard in shard_map.get("shards", []):
-            shard_file = shard["file"].replace("/data/", "")
-            shard_path = DATA_DIR / shard_file
-            
-            if not shard_path.exists():
-                errors.append(f"Shard map references missing file: {shard['file']}")
-                continue
-            
-            # Check actual count matches reported count
-            actual_certs = load_json(shard_path)
-            actual_count = len(actual_certs)
-            reported_count = shard.get("count", 0)
-            
-            if actual_count != reported_count:
-                errors.append(
-                    f"Shard {shard['letters']}: Count mismatch - "
-                    f"reported {reported_count}, actual {actual_count}"
-                )
-            
-            total_count += actual_count
-            
-            # Check file size is reasonable
-            actual_size = shard_path.stat().st_size
-            reported_size = shard.get("size_bytes", 0)
-            
-            # Allow 10% variance in file size (due to formatting differences)
-            if abs(actual_size - reported_size) > reported_size * 0.1:
-                errors.append(
-                    f"Shard {shard['letters']}: Size mismatch - "
-                    f"reported {reported_size} bytes, actual {actual_size} bytes"
-                )
-        
-        print(f"📊 Shard integrity check: {len(shard_map.get('shards', []))} shards, {total_count} total certs")
-        
-    except Exception as e:
-        errors.append(f"Shard map validation error: {e}")
+    if actual_count != reported_count:
+        errors.append(
+            f"Shard {shard['letters']}: Count mismatch - "
+            f"reported {reported_count}, actual {actual_count}"
+        )
+    
+    # Check file size is reasonable
+    actual_size = shard_path.stat().st_size
+    reported_size = shard.get("size_bytes", 0)
+    
+    # Allow 10% variance in file size (due to formatting differences)
+    if abs(actual_size - reported_size) > reported_size * 0.1:
+        errors.append(
+            f"Shard {shard['letters']}: Size mismatch - "
+            f"reported {reported_size} bytes, actual {actual_size} bytes"
+        )
     
     return errors
 
-def check_duplicate_slugs(cert_slugs: Set[str]) -> List[str]:
-    """Check for duplicate certification slugs"""
-    errors = []
-    all_slugs = []
+def scan_certifications() -> Tuple[FrozenSet[str], List[str], List[str]]:
+    """Walk the sharded or legacy certification files once.
+    
+    Returns the certification slugs, shard integrity errors and duplicate slug errors.
+    """
+    sources_by_slug = defaultdict(list)
+    integrity_errors = []
     
-    # Collect all slugs with their sources
+    # Check if sharding is enabled
     map_path = DATA_DIR / "certifications" / "index.map.json"
     
     if map_path.exists():
-        # Check shards for duplicates
+        # Load from shards, checking each against the map as it is read
         shard_map = load_json(map_path)
-        for shard in shard_map.get("shards", []):
-            shard_file = shard["file"].replace("/data/", "")
-            shard_path = DATA_DIR / shard_file
+        total_count = 0
+        try:
+            for shard, shard_path, certs in load_shards(shard_map):
+                if certs is None:
+                    integrity_errors.append(f"Shard map references missing file: {shard['file']}")
+                    continue
+                
+                for slug in map(get_slug, certs):
+                    sources_by_slug[slug].append(shard["file"])
+                
+                integrity_errors.extend(check_shard_entry(shard, shard_path, len(certs)))
+                total_count += len(certs)
             
-            if shard_path.exists():
-                certs = load_json(shard_path)
-                for cert in certs:
-                    all_slugs.append((cert["slug"], shard["file"]))
+            print(f"📊 Shard integrity check: {len(shard_map.get('shards', []))} shards, {total_count} total certs")
+        
+        except Exception as e:
+            integrity_errors.append(f"Shard map validation error: {e}")
     else:
-        # Check legacy file
+        # Load from legacy file
         index_path = DATA_DIR / "certifications" / "index.json"
         if index_path.exists():
             certs = load_json(index_path)
-            for cert in certs:
-                all_slugs.append((cert["slug"], "index.json"))
+            for slug in map(get_slug, certs):
+                sources_by_slug[slug].append("index.json")
     
-    # Find duplicates
-    slug_counts = {}
-    for slug, source in all_slugs:
-        if slug in slug_counts:
-            errors.append(f"Duplicate slug '{slug}' found in {source} and {slug_counts[slug]}")
-        else:
-            slug_counts[slug] = source
+    # Report each duplicated slug once, listing every source it appears in
+    duplicate_errors = []
+    for slug, sources in sources_by_slug.items():
+        if len(sources) > 1:
+            duplicate_errors.append(f"Duplicate slug '{slug}' found {len(sources)} times in {', '.join(sources)}")
     
-    return errors
+    return frozenset(sources_by_slug), integrity_errors, duplicate_errors
 
 def main():
     """Main referential integrity check"""
@@ -201,7 +218,7 @@ def main():
     
     # Get all certification slugs
     print("📋 Loading certification slugs...")
-    cert_slugs = get_all_certification_slugs()
+    cert_slugs, integrity_errors, duplicate_errors = scan_certifications()
     print(f"   Found {len(cert_slugs)} certification slugs")
     
     # Run all checks
@@ -210,8 +227,8 @@ def main():
     all_errors.extend(check_rankings_references(cert_slugs))
     all_errors.extend(check_company_references(cert_slugs))
     all_errors.extend(check_manifest_references())
-    all_errors.extend(check_shard_integrity())
-    all_errors.extend(check_duplicate_slugs(cert_slugs))
+    all_errors.extend(integrity_errors)
+    all_errors.extend(duplicate_errors)
     
     # Summary
     print(f"\n{'='*60}")
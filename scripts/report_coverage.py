@@ -4,15 +4,28 @@ Report coverage statistics per field and domain for certifications
 """
 
 import json
+import mmap
 import pathlib
 from collections import defaultdict, Counter
 from typing import Dict, List, Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 DATA_DIR = ROOT / "web" / "public" / "data"
+MMAP_MIN_BYTES = 256 * 1024  # Smaller files are cheaper to read into memory
 
 def load_json(path: pathlib.Path) -> Any:
-    """Load JSON file"""
+    """Load JSON file; large files are parsed straight from a read-only mmap"""
+    if orjson is not None:
+        if path.stat().st_size > MMAP_MIN_BYTES:
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    return orjson.loads(view)
+        return orjson.loads(path.read_bytes())
     with open(path, "r", encoding="utf-8") as f:
         return json.load(f)
 
@@ -20,7 +33,6 @@ def calculate_coverage(certifications: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Calculate coverage statistics per field and domain"""
     
     total_certs = len(certifications)
-    domain_counts = Counter(cert["domain"] for cert in certifications)
     
     # Fields to check for coverage
     fields_to_check = [
@@ -37,10 +49,28 @@ def calculate_coverage(certifications: List[Dict[str, Any]]) -> Dict[str, Any]:
         "ce_credits"
     ]
     
+    # Count everything in one pass: non-null fields overall and per domain (indexed like
+    # fields_to_check), certifications per domain, and source types
+    domain_counts = Counter()
+    overall_counts = [0] * len(fields_to_check)
+    domain_field_counts = defaultdict(lambda: [0] * len(fields_to_check))
+    source_types = Counter()
+    for cert in certifications:
+        domain = cert["domain"]
+        domain_counts[domain] += 1
+        field_counts = domain_field_counts[domain]
+        for i, field in enumerate(fields_to_check):
+            if cert.get(field) is not None:
+                overall_counts[i] += 1
+                field_counts[i] += 1
+        
+        if "sources" in cert and cert["sources"]:
+            for source in cert["sources"]:
+                source_types[source.get("type", "unknown")] += 1
+    
     # Overall coverage
     overall_coverage = {}
-    for field in fields_to_check:
-        non_null_count = sum(1 for cert in certifications if cert.get(field) is not None)
+    for field, non_null_count in zip(fields_to_check, overall_counts):
         overall_coverage[field] = {
             "total": total_certs,
             "non_null": non_null_count,
@@ -49,29 +79,18 @@ def calculate_coverage(certifications: List[Dict[str, Any]]) -> Dict[str, Any]:
     
     # Domain-specific coverage
     domain_coverage = {}
-    for domain in domain_counts.keys():
-        domain_certs = [cert for cert in certifications if cert["domain"] == domain]
-        domain_total = len(domain_certs)
-        
+    for domain, domain_total in domain_counts.items():
         domain_coverage[domain] = {
             "total_certs": domain_total,
             "fields": {}
         }
         
-        for field in fields_to_check:
-            non_null_count = sum(1 for cert in domain_certs if cert.get(field) is not None)
+        for field, non_null_count in zip(fields_to_check, domain_field_counts[domain]):
             domain_coverage[domain]["fields"][field] = {
                 "non_null": non_null_count,
                 "coverage_pct": round((non_null_count / domain_total) * 100, 1) if domain_total > 0 else 0
             }
     
-    # Source type distribution
-    source_types = Counter()
-    for cert in certifications:
-        if "sources" in cert and cert["sources"]:
-            for source in cert["sources"]:
-                source_types[source.get("type", "unknown")] += 1
-    
     return {
         "total_certifications": total_certs,
         "domain_distribution": dict(domain_counts),
@@ -8,9 +8,9 @@ import json
 import pathlib
 import datetime
 import re
-import string
 from collections import defaultdict
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional
 import requests
 from bs4 import BeautifulSoup
 
@@ -20,8 +20,14 @@ import pathlib
 sys.path.append(str(pathlib.Path(__file__).resolve().parent))
 from domains import healthcare, finance, skilled_trades
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 DATA_DIR = ROOT / "web" / "public" / "data"
+SHARD_WRITE_WORKERS = 8
 
 # Domain label to slug mapping for consistency
 DOMAIN_MAP = {
@@ -35,29 +41,72 @@ DOMAIN_MAP = {
     "Skilled-Trades": "skilled-trades",
 }
 
+# Field order of scraped vendor certifications; vendor templates and per-cert values fill the None slots
+CERT_TEMPLATE = {
+    "slug": None,
+    "name": None,
+    "domain": None,
+    "issuer": None,
+    "url": None,
+    "level": None,
+    "exam_fee_usd": None,
+    "price_source": "official",
+    "recommended_hours_min": None,
+    "recommended_hours_max": None,
+    "hours_source": "estimate",
+    "validity_years": None,
+    "delivery": None,
+    "format": "multiple choice",
+    "regions": "Global",
+    "last_checked_utc": None,
+}
+
 def normalize_domain_slug(domain_label: str) -> str:
     """Convert domain label to consistent slug format"""
     return DOMAIN_MAP.get(domain_label.strip(), "cs-it")
 
+def load_json(path: pathlib.Path) -> Any:
+    """Load JSON file"""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
 def save_json(path: pathlib.Path, data: Any) -> None:
     """Save data as JSON with proper formatting"""
     path.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
     with open(path, "w", encoding="utf-8") as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
 
+_NON_SLUG_CHARS = re.compile(r'[^\w\s-]')
+_SLUG_SEPARATORS = re.compile(r'[-\s]+')
+# Deletion table for the ASCII characters _NON_SLUG_CHARS strips, so ASCII names skip that regex
+_NON_SLUG_ASCII = str.maketrans('', '', ''.join(c for c in map(chr, range(128)) if _NON_SLUG_CHARS.match(c)))
+
 def slugify(text: str) -> str:
     """Convert text to URL-friendly slug"""
-    slug = re.sub(r'[^\w\s-]', '', text.lower())
-    slug = re.sub(r'[-\s]+', '-', slug)
+    text = text.lower()
+    slug = text.translate(_NON_SLUG_ASCII) if text.isascii() else _NON_SLUG_CHARS.sub('', text)
+    slug = _SLUG_SEPARATORS.sub('-', slug)
     return slug.strip('-')
 
+# Shard key for each ASCII code point: letters map to their lowercase form, everything else to "0-9"
+_SHARD_KEYS = tuple(chr(code).lower() if chr(code).isalpha() else "0-9" for code in range(128))
+
 def get_shard_key(cert_name: str) -> str:
-    """Get shard key based on first letter of certification name"""
-    first_char = cert_name[0].lower()
-    if first_char in string.ascii_lowercase:
-        return first_char
-    else:
+    """Get shard key based on first letter of certification name (empty names map to 0-9)"""
+    if not cert_name:
         return "0-9"
+    code = ord(cert_name[0])
+    return _SHARD_KEYS[code] if code < 128 else "0-9"
+
+def write_shard(path: pathlib.Path, certs: List[Dict[str, Any]]) -> int:
+    """Save one shard file and return its size in bytes"""
+    save_json(path, certs)
+    return path.stat().st_size
 
 def shard_certifications(all_certs: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Shard certifications by first letter and create index map"""
@@ -70,31 +119,36 @@ def shard_certifications(all_certs: List[Dict[str, Any]]) -> Dict[str, Any]:
         shard_key = get_shard_key(cert["name"])
         shards[shard_key].append(cert)
     
-    # Create shards and index map
-    shard_map = {"shards": []}
-    total_size = 0
-    
+    # Determine each shard's filename and range
+    tasks = []
     for shard_key in sorted(shards.keys()):
-        certs_in_shard = shards[shard_key]
-        
-        # Determine shard filename and range
         if shard_key == "0-9":
             filename = "0-9.json"
             letters = "0-9"
         else:
             filename = f"{shard_key}.json"
             letters = shard_key
-        
-        shard_path = DATA_DIR / "certifications" / filename
-        save_json(shard_path, certs_in_shard)
-        
-        # Calculate size
-        shard_size = shard_path.stat().st_size
+        tasks.append((filename, letters, shards[shard_key]))
+    
+    # Write the shard files concurrently
+    with ThreadPoolExecutor(max_workers=SHARD_WRITE_WORKERS) as executor:
+        shard_sizes = list(executor.map(
+            write_shard,
+            [DATA_DIR / "certifications" / filename for filename, _, _ in tasks],
+            [certs_in_shard for _, _, certs_in_shard in tasks],
+        ))
+    
+    # Create index map
+    shard_map = {"shards": []}
+    total_size = 0
+    
+    for (filename, letters, certs_in_shard), shard_size in zip(tasks, shard_sizes):
         total_size += shard_size
         
         # Add to map
         shard_map["shards"].append({
             "file": f"/data/certifications/{filename}",
+            "rel_path": f"certifications/{filename}",
             "letters": letters,
             "count": len(certs_in_shard),
             "size_bytes": shard_size
@@ -104,11 +158,12 @@ def shard_certifications(all_certs: List[Dict[str, Any]]) -> Dict[str, Any]:
     
     return shard_map
 
-def scrape_certifications() -> List[Dict[str, Any]]:
+def scrape_certifications(now: Optional[str] = None) -> List[Dict[str, Any]]:
     """Generate certification data using known vendors and heuristics"""
     
     certifications = []
-    now = datetime.datetime.utcnow().isoformat() + "Z"
+    if now is None:
+        now = datetime.datetime.utcnow().isoformat() + "Z"
     
     # AWS Certifications
     aws_certs = [
@@ -149,25 +204,15 @@ def scrape_certifications() -> List[Dict[str, Any]]:
         }
     ]
     
-    for cert in aws_certs:
-        certifications.append({
-            "slug": slugify(cert["name"]),
-            "name": cert["name"],
-            "domain": "CS/IT",
-            "issuer": "Amazon Web Services (AWS)",
-            "url": "https://aws.amazon.com/certification/",
-            "level": cert["level"],
-            "exam_fee_usd": cert["exam_fee_usd"],
-            "price_source": "official",
-            "recommended_hours_min": cert["recommended_hours_min"],
-            "recommended_hours_max": cert["recommended_hours_max"],
-            "hours_source": "estimate",
-            "validity_years": 3,
-            "delivery": "online proctored or test center",
-            "format": "multiple choice",
-            "regions": "Global",
-            "last_checked_utc": now
-        })
+    aws_template = CERT_TEMPLATE | {
+        "domain": "CS/IT",
+        "issuer": "Amazon Web Services (AWS)",
+        "url": "https://aws.amazon.com/certification/",
+        "validity_years": 3,
+        "delivery": "online proctored or test center",
+        "last_checked_utc": now,
+    }
+    certifications.extend(aws_template | {"slug": slugify(cert["name"]), **cert} for cert in aws_certs)
     
     # Microsoft Azure Certifications
     azure_certs = [
@@ -194,25 +239,15 @@ def scrape_certifications() -> List[Dict[str, Any]]:
         }
     ]
     
-    for cert in azure_certs:
-        certifications.append({
-            "slug": slugify(cert["name"]),
-            "name": cert["name"],
-            "domain": "CS/IT",
-            "issuer": "Microsoft",
-            "url": "https://learn.microsoft.com/en-us/certifications/",
-            "level": cert["level"],
-            "exam_fee_usd": cert["exam_fee_usd"],
-            "price_source": "official",
-            "recommended_hours_min": cert["recommended_hours_min"],
-            "recommended_hours_max": cert["recommended_hours_max"],
-            "hours_source": "estimate",
-            "validity_years": 2,
-            "delivery": "online proctored or test center",
-            "format": "multiple choice",
-            "regions": "Global",
-            "last_checked_utc": now
-        })
+    azure_template = CERT_TEMPLATE | {
+        "domain": "CS/IT",
+        "issuer": "Microsoft",
+        "url": "https://learn.microsoft.com/en-us/certifications/",
+        "validity_years": 2,
+        "delivery": "online proctored or test center",
+        "last_checked_utc": now,
+    }
+    certifications.extend(azure_template | {"slug": slugify(cert["name"]), **cert} for cert in azure_certs)
     
     # Google Cloud Certifications
     gcp_certs = [
@@ -239,25 +274,15 @@ def scrape_certifications() -> List[Dict[str, Any]]:
         }
     ]
     
-    for cert in gcp_certs:
-        certifications.append({
-            "slug": slugify(cert["name"]),
-            "name": cert["name"],
-            "domain": "CS/IT",
-            "issuer": "Google Cloud",
-            "url": "https://cloud.google.com/certification",
-            "level": cert["level"],
-            "exam_fee_usd": cert["exam_fee_usd"],
-            "price_source": "official",
-            "recommended_hours_min": cert["recommended_hours_min"],
-            "recommended_hours_max": cert["recommended_hours_max"],
-            "hours_source": "estimate",
-            "validity_years": 2,
-            "delivery": "online proctored or test center",
-            "format": "multiple choice",
-            "regions": "Global",
-            "last_checked_utc": now
-        })
+    gcp_template = CERT_TEMPLATE | {
+        "domain": "CS/IT",
+        "issuer": "Google Cloud",
+        "url": "https://cloud.google.com/certification",
+        "validity_years": 2,
+        "delivery": "online proctored or test center",
+        "last_checked_utc": now,
+    }
+    certifications.extend(gcp_template | {"slug": slugify(cert["name"]), **cert} for cert in gcp_certs)
     
     # CompTIA Certifications
     comptia_certs = [
@@ -284,25 +309,15 @@ def scrape_certifications() -> List[Dict[str, Any]]:
         }
     ]
     
-    for cert in comptia_certs:
-        certifications.append({
-            "slug": slugify(cert["name"]),
-            "name": cert["name"],
-            "domain": "CS/IT",
-            "issuer": "CompTIA",
-            "url": "https://www.comptia.org/certifications",
-            "level": cert["level"],
-            "exam_fee_usd": cert["exam_fee_usd"],
-            "price_source": "official",
-            "recommended_hours_min": cert["recommended_hours_min"],
-            "recommended_hours_max": cert["recommended_hours_max"],
-            "hours_source": "estimate",
-            "validity_years": 3,
-            "delivery": "test center",
-            "format": "multiple choice",
-            "regions": "Global",
-            "last_checked_utc": now
-        })
+    comptia_template = CERT_TEMPLATE | {
+        "domain": "CS/IT",
+        "issuer": "CompTIA",
+        "url": "https://www.comptia.org/certifications",
+        "validity_years": 3,
+        "delivery": "test center",
+        "last_checked_utc": now,
+    }
+    certifications.extend(comptia_template | {"slug": slugify(cert["name"]), **cert} for cert in comptia_certs)
     
     # Project Management Certifications
     pm_certs = [
@@ -322,25 +337,15 @@ def scrape_certifications() -> List[Dict[str, Any]]:
         }
     ]
     
-    for cert in pm_certs:
-        certifications.append({
-            "slug": slugify(cert["name"]),
-            "name": cert["name"],
-            "domain": "Engineering / Business",
-            "issuer": "Project Management Institute (PMI)",
-            "url": "https://www.pmi.org/certifications",
-            "level": cert["level"],
-            "exam_fee_usd": cert["exam_fee_usd"],
-            "price_source": "official",
-            "recommended_hours_min": cert["recommended_hours_min"],
-            "recommended_hours_max": cert["recommended_hours_max"],
-            "hours_source": "estimate",
-            "validity_years": 3,
-            "delivery": "test center or online",
-            "format": "multiple choice",
-            "regions": "Global",
-            "last_checked_utc": now
-        })
+    pm_template = CERT_TEMPLATE | {
+        "domain": "Engineering / Business",
+        "issuer": "Project Management Institute (PMI)",
+        "url": "https://www.pmi.org/certifications",
+        "validity_years": 3,
+        "delivery": "test center or online",
+        "last_checked_utc": now,
+    }
+    certifications.extend(pm_template | {"slug": slugify(cert["name"]), **cert} for cert in pm_certs)
     
     # Cisco Certifications
     cisco_certs = [
@@ -360,25 +365,16 @@ def scrape_certifications() -> List[Dict[str, Any]]:
         }
     ]
     
-    for cert in cisco_certs:
-        certifications.append({
-            "slug": slugify(cert["name"]),
-            "name": cert["name"],
-            "domain": "CS/IT",
-            "issuer": "Cisco",
-            "url": "https://www.cisco.com/c/en/us/training-events/training-certifications.html",
-            "level": cert["level"],
-            "exam_fee_usd": cert["exam_fee_usd"],
-            "price_source": "official",
-            "recommended_hours_min": cert["recommended_hours_min"],
-            "recommended_hours_max": cert["recommended_hours_max"],
-            "hours_source": "estimate",
-            "validity_years": 3,
-            "delivery": "test center",
-            "format": "multiple choice and lab",
-            "regions": "Global",
-            "last_checked_utc": now
-        })
+    cisco_template = CERT_TEMPLATE | {
+        "domain": "CS/IT",
+        "issuer": "Cisco",
+        "url": "https://www.cisco.com/c/en/us/training-events/training-certifications.html",
+        "validity_years": 3,
+        "delivery": "test center",
+        "format": "multiple choice and lab",
+        "last_checked_utc": now,
+    }
+    certifications.extend(cisco_template | {"slug": slugify(cert["name"]), **cert} for cert in cisco_certs)
     
     return certifications
 
@@ -386,30 +382,32 @@ def main():
     """Main function to scrape and save certification data"""
     print("Scraping certification data...")
     
+    # One timestamp for the whole run, shared by every certification record
+    now = sys.intern(datetime.datetime.utcnow().isoformat() + "Z")
+    
     # Get certifications from all sources
     certifications = []
     
     # Add existing CS/IT certifications
-    certifications.extend(scrape_certifications())
+    certifications.extend(scrape_certifications(now))
     
     # Add new domain certifications
     print("Adding Healthcare certifications...")
-    healthcare_certs = healthcare.produce()
+    healthcare_certs = healthcare.produce(now)
     certifications.extend(healthcare_certs)
     print(f"  ✅ Added {len(healthcare_certs)} Healthcare certifications")
     
     print("Adding Finance certifications...")
-    finance_certs = finance.produce()
+    finance_certs = finance.produce(now)
     certifications.extend(finance_certs)
     print(f"  ✅ Added {len(finance_certs)} Finance certifications")
     
     print("Adding Skilled Trades certifications...")
-    trades_certs = skilled_trades.produce()
+    trades_certs = skilled_trades.produce(now)
     certifications.extend(trades_certs)
     print(f"  ✅ Added {len(trades_certs)} Skilled Trades certifications")
     
     # Add sources field to existing certs if missing and normalize domain slugs
-    now = datetime.datetime.utcnow().isoformat() + "Z"
     for cert in certifications:
         if "sources" not in cert:
             cert["sources"] = [{
@@ -437,15 +435,15 @@ def main():
     # Update manifest
     manifest_path = DATA_DIR / "manifest.json"
     if manifest_path.exists():
-        with open(manifest_path, "r", encoding="utf-8") as f:
-            manifest = json.load(f)
+        manifest = load_json(manifest_path)
         
+        shard_sizes = [s["size_bytes"] for s in shard_map["shards"]]
         manifest["files"]["certifications_map"] = "/data/certifications/index.map.json"
         manifest["sharding"] = {
             "enabled": True,
-            "total_shards": len(shard_map["shards"]),
-            "total_size_bytes": sum(s["size_bytes"] for s in shard_map["shards"]),
-            "max_shard_size_bytes": max(s["size_bytes"] for s in shard_map["shards"])
+            "total_shards": len(shard_sizes),
+            "total_size_bytes": sum(shard_sizes),
+            "max_shard_size_bytes": max(shard_sizes)
         }
         
         save_json(manifest_path, manifest)
@@ -6,26 +6,48 @@ Creates index.map.json and sharded files based on first letter
 
 import json
 import pathlib
-import string
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 DATA_DIR = ROOT / "web" / "public" / "data"
+SHARD_WRITE_WORKERS = 8
+
+def load_json(path: pathlib.Path) -> Any:
+    """Load JSON file"""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def dumps_json(data: Any) -> bytes:
+    """Serialize data to the UTF-8 bytes save_json writes"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
 
-def save_json(path: pathlib.Path, data: Any) -> None:
-    """Save data as JSON with proper formatting"""
+def save_json(path: pathlib.Path, data: Any) -> int:
+    """Save data as JSON with proper formatting and return the file size in bytes"""
+    payload = dumps_json(data)
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    path.write_bytes(payload)
+    return len(payload)
+
+# Shard key for each ASCII code point: letters map to their lowercase form, everything else to "0-9"
+_SHARD_KEYS = tuple(chr(code).lower() if chr(code).isalpha() else "0-9" for code in range(128))
 
 def get_shard_key(cert_name: str) -> str:
-    """Get shard key based on first letter of certification name"""
-    first_char = cert_name[0].lower()
-    if first_char in string.ascii_lowercase:
-        return first_char
-    else:
+    """Get shard key based on first letter of certification name (empty names map to 0-9)"""
+    if not cert_name:
         return "0-9"
+    code = ord(cert_name[0])
+    return _SHARD_KEYS[code] if code < 128 else "0-9"
 
 def shard_certifications():
     """Shard certifications by first letter and create index map"""
@@ -36,8 +58,7 @@ def shard_certifications():
         print("❌ No certifications/index.json found. Run scrape_certs.py first.")
         return
     
-    with open(index_path, "r", encoding="utf-8") as f:
-        all_certs = json.load(f)
+    all_certs = load_json(index_path)
     
     print(f"📊 Sharding {len(all_certs)} certifications...")
     
@@ -47,31 +68,39 @@ def shard_certifications():
         shard_key = get_shard_key(cert["name"])
         shards[shard_key].append(cert)
     
-    # Create shards and index map
-    shard_map = {"shards": []}
-    total_size = 0
-    
+    # Determine each shard's filename and range
+    tasks = []
     for shard_key in sorted(shards.keys()):
-        certs_in_shard = shards[shard_key]
-        
-        # Determine shard filename and range
         if shard_key == "0-9":
             filename = "0-9.json"
             letters = "0-9"
         else:
             filename = f"{shard_key}.json"
             letters = shard_key
-        
-        shard_path = DATA_DIR / "certifications" / filename
-        save_json(shard_path, certs_in_shard)
-        
-        # Calculate size
-        shard_size = shard_path.stat().st_size
+        tasks.append((filename, letters, shards[shard_key]))
+    
+    # Write the shard files concurrently
+    with ThreadPoolExecutor(max_workers=SHARD_WRITE_WORKERS) as executor:
+        shard_sizes = list(executor.map(
+            save_json,
+            [DATA_DIR / "certifications" / filename for filename, _, _ in tasks],
+            [certs_in_shard for _, _, certs_in_shard in tasks],
+        ))
+    
+    # Create index map
+    shard_map = {"shards": []}
+    total_size = 0
+    max_shard_size = 0
+    
+    for (filename, letters, certs_in_shard), shard_size in zip(tasks, shard_sizes):
         total_size += shard_size
+        if shard_size > max_shard_size:
+            max_shard_size = shard_size
         
         # Add to map
         shard_map["shards"].append({
             "file": f"/data/certifications/{filename}",
+            "rel_path": f"certifications/{filename}",
             "letters": letters,
             "count": len(certs_in_shard),
             "size_bytes": shard_size
@@ -79,6 +108,10 @@ def shard_certifications():
         
         print(f"  ✅ {filename}: {len(certs_in_shard)} certs ({shard_size:,} bytes)")
     
+    # Optionally keep the original index.json for backward compatibility
+    # but mark it as deprecated in the map
+    shard_map["deprecated_files"] = ["/data/certifications/index.json"]
+    
     # Save shard map
     map_path = DATA_DIR / "certifications" / "index.map.json"
     save_json(map_path, shard_map)
@@ -86,15 +119,14 @@ def shard_certifications():
     # Update manifest
     manifest_path = DATA_DIR / "manifest.json"
     if manifest_path.exists():
-        with open(manifest_path, "r", encoding="utf-8") as f:
-            manifest = json.load(f)
+        manifest = load_json(manifest_path)
         
         manifest["files"]["certifications_map"] = "/data/certifications/index.map.json"
         manifest["sharding"] = {
             "enabled": True,
             "total_shards": len(shard_map["shards"]),
             "total_size_bytes": total_size,
-            "max_shard_size_bytes": max(s["size_bytes"] for s in shard_map["shards"])
+            "max_shard_size_bytes": max_shard_size
         }
         
         save_json(manifest_path, manifest)
@@ -103,11 +135,6 @@ def shard_certifications():
     print(f"  📁 {len(shard_map['shards'])} shards created")
     print(f"  📏 Total size: {total_size:,} bytes")
     print(f"  📋 Index map: {map_path}")
-    
-    # Optionally keep the original index.json for backward compatibility
-    # but mark it as deprecated in the map
-    shard_map["deprecated_files"] = ["/data/certifications/index.json"]
-    save_json(map_path, shard_map)
 
 if __name__ == "__main__":
     shard_certifications()
\ No newline at end of file
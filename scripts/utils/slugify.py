@@ -1,7 +1,7 @@
 import re
 
+_NON_SLUG_RUNS = re.compile(r'[^a-z0-9]+')
+
 def slugify(s: str) -> str:
     """Convert a string to a URL-friendly slug."""
-    s = s.lower()
-    s = re.sub(r'[^a-z0-9]+', '-', s)
-    return s.strip('-')
\ No newline at end of file
+    return _NON_SLUG_RUNS.sub('-', s.lower()).strip('-')
\ No newline at end of file
@@ -7,16 +7,104 @@ Ensures data integrity before deployment
 import json
 import pathlib
 import jsonschema
-from jsonschema import validate, ValidationError, draft7_format_checker
+from jsonschema import ValidationError, draft7_format_checker
 import sys
 from typing import Dict, List, Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 DATA_DIR = ROOT / "web" / "public" / "data"
 SCHEMAS_DIR = ROOT / "schemas"
 
+# Schemas for data files without a schema file of their own
+TRENDS_SCHEMA = {
+    "type": "object",
+    "patternProperties": {
+        "^[a-z0-9-]+$": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["date", "rank"],
+                "properties": {
+                    "date": {"type": "string", "format": "date"},
+                    "rank": {"type": "integer", "minimum": 1}
+                }
+            }
+        }
+    }
+}
+
+RECOMMENDATIONS_SCHEMA = {
+    "type": "object",
+    "patternProperties": {
+        "^.+$": {  # Domain names
+            "type": "object",
+            "patternProperties": {
+                "^[a-z0-9-]+$": {  # Company slugs
+                    "type": "array",
+                    "maxItems": 3,
+                    "items": {
+                        "type": "object",
+                        "required": ["slug", "fit_score", "signals"],
+                        "properties": {
+                            "slug": {"type": "string", "pattern": "^[a-z0-9-]+$"},
+                            "fit_score": {"type": "number", "minimum": 0, "maximum": 1},
+                            "signals": {
+                                "type": "object",
+                                "required": ["role_alignment", "global_rank_norm", "cost_penalty"],
+                                "properties": {
+                                    "role_alignment": {"type": "number", "minimum": 0, "maximum": 1},
+                                    "global_rank_norm": {"type": "number", "minimum": 0, "maximum": 1},
+                                    "cost_penalty": {"type": "number", "minimum": 0, "maximum": 1},
+                                    "mention_count": {"type": "integer", "minimum": 0},
+                                    "mention_z": {"type": "number"}
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+}
+
+DEMAND_SCHEMA = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "required": ["slug", "job_postings_7d", "job_postings_30d"],
+        "properties": {
+            "slug": {"type": "string", "pattern": "^[a-z0-9-]+$"},
+            "job_postings_7d": {"type": "integer", "minimum": 0},
+            "job_postings_30d": {"type": "integer", "minimum": 0}
+        }
+    }
+}
+
+SALARIES_SCHEMA = {
+    "type": "object",
+    "patternProperties": {
+        "^.+$": {  # Role names
+            "type": "object",
+            "required": ["median_usd", "p25", "p75", "source"],
+            "properties": {
+                "median_usd": {"type": "integer", "minimum": 0},
+                "p25": {"type": "integer", "minimum": 0},
+                "p75": {"type": "integer", "minimum": 0},
+                "source": {"type": "string"}
+            }
+        }
+    }
+}
+
 def load_json(path: pathlib.Path) -> Any:
     """Load JSON file"""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
     with open(path, "r", encoding="utf-8") as f:
         return json.load(f)
 
@@ -27,15 +115,23 @@ def load_schema(schema_name: str) -> Dict:
         raise FileNotFoundError(f"Schema not found: {schema_path}")
     return load_json(schema_path)
 
-def validate_file(data_path: pathlib.Path, schema: Dict, description: str) -> bool:
-    """Validate a single data file against schema"""
+def compile_validator(schema: Dict) -> Any:
+    """Check a schema once and build a validator that is reused for every document"""
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema, format_checker=draft7_format_checker)
+
+def validate_file(data_path: pathlib.Path, validator: Any, description: str) -> bool:
+    """Validate a single data file with a compiled validator"""
     try:
         if not data_path.exists():
             print(f"⚠️  {description}: File not found - {data_path}")
             return False
         
         data = load_json(data_path)
-        validate(instance=data, schema=schema, format_checker=draft7_format_checker)
+        error = jsonschema.exceptions.best_match(validator.iter_errors(data))
+        if error is not None:
+            raise error
         print(f"✅ {description}: Valid")
         return True
         
@@ -52,7 +148,7 @@ def validate_file(data_path: pathlib.Path, schema: Dict, description: str) -> bo
 
 def validate_certifications() -> bool:
     """Validate certification files (both sharded and legacy)"""
-    schema = load_schema("certification")
+    validator = compile_validator({"type": "array", "items": load_schema("certification")})
     
     # Check if sharding is enabled
     map_path = DATA_DIR / "certifications" / "index.map.json"
@@ -67,10 +163,11 @@ def validate_certifications() -> bool:
             
             # Validate each shard
             for shard in shard_map.get("shards", []):
-                shard_file = shard["file"].replace("/data/", "")
+                # rel_path is relative to DATA_DIR; maps written before it existed only have the web path
+                shard_file = shard.get("rel_path") or shard["file"].replace("/data/", "")
                 shard_path = DATA_DIR / shard_file
                 
-                if not validate_file(shard_path, {"type": "array", "items": schema}, 
+                if not validate_file(shard_path, validator, 
                                    f"Shard {shard['letters']} ({shard['count']} certs)"):
                     all_valid = False
             
@@ -83,98 +180,44 @@ def validate_certifications() -> bool:
         # Validate legacy single file
         print("📄 Validating legacy certification file...")
         index_path = DATA_DIR / "certifications" / "index.json"
-        return validate_file(index_path, {"type": "array", "items": schema}, "Certifications index")
+        return validate_file(index_path, validator, "Certifications index")
 
 def validate_rankings() -> bool:
     """Validate rankings files"""
-    schema = load_schema("rankings")
     all_valid = True
     
     # Validate today's rankings
     today_path = DATA_DIR / "rankings" / "today.json"
-    if not validate_file(today_path, schema, "Today's rankings"):
+    if not validate_file(today_path, compile_validator(load_schema("rankings")), "Today's rankings"):
         all_valid = False
     
     # Validate trends (different schema - it's an object with arrays)
     trends_path = DATA_DIR / "rankings" / "trends.json"
-    trends_schema = {
-        "type": "object",
-        "patternProperties": {
-            "^[a-z0-9-]+$": {
-                "type": "array",
-                "items": {
-                    "type": "object",
-                    "required": ["date", "rank"],
-                    "properties": {
-                        "date": {"type": "string", "format": "date"},
-                        "rank": {"type": "integer", "minimum": 1}
-                    }
-                }
-            }
-        }
-    }
-    
-    if not validate_file(trends_path, trends_schema, "Ranking trends"):
+    if not validate_file(trends_path, compile_validator(TRENDS_SCHEMA), "Ranking trends"):
         all_valid = False
     
     return all_valid
 
 def validate_companies() -> bool:
     """Validate company files"""
-    schema = load_schema("companies")
     all_valid = True
     
     # Validate companies by domain
     companies_path = DATA_DIR / "companies" / "by_domain.json"
-    if not validate_file(companies_path, schema, "Companies by domain"):
+    if not validate_file(companies_path, compile_validator(load_schema("companies")), "Companies by domain"):
         all_valid = False
     
     # Validate recommendations (complex nested structure)
     recommendations_path = DATA_DIR / "companies" / "recommendations.json"
-    recommendations_schema = {
-        "type": "object",
-        "patternProperties": {
-            "^.+$": {  # Domain names
-                "type": "object",
-                "patternProperties": {
-                    "^[a-z0-9-]+$": {  # Company slugs
-                        "type": "array",
-                        "maxItems": 3,
-                        "items": {
-                            "type": "object",
-                            "required": ["slug", "fit_score", "signals"],
-                            "properties": {
-                                "slug": {"type": "string", "pattern": "^[a-z0-9-]+$"},
-                                "fit_score": {"type": "number", "minimum": 0, "maximum": 1},
-                                "signals": {
-                                    "type": "object",
-                                    "required": ["role_alignment", "global_rank_norm", "cost_penalty"],
-                                    "properties": {
-                                        "role_alignment": {"type": "number", "minimum": 0, "maximum": 1},
-                                        "global_rank_norm": {"type": "number", "minimum": 0, "maximum": 1},
-                                        "cost_penalty": {"type": "number", "minimum": 0, "maximum": 1},
-                                        "mention_count": {"type": "integer", "minimum": 0},
-                                        "mention_z": {"type": "number"}
-                                    }
-                                }
-                            }
-                        }
-                    }
-                }
-            }
-        }
-    }
-    
-    if not validate_file(recommendations_path, recommendations_schema, "Company recommendations"):
+    if not validate_file(recommendations_path, compile_validator(RECOMMENDATIONS_SCHEMA), "Company recommendations"):
         all_valid = False
     
     return all_valid
 
 def validate_manifest() -> bool:
     """Validate manifest file"""
-    schema = load_schema("manifest")
     manifest_path = DATA_DIR / "manifest.json"
-    return validate_file(manifest_path, schema, "Data manifest")
+    return validate_file(manifest_path, compile_validator(load_schema("manifest")), "Data manifest")
 
 def validate_other_files() -> bool:
     """Validate other data files"""
@@ -182,41 +225,12 @@ def validate_other_files() -> bool:
     
     # Validate demand metrics
     demand_path = DATA_DIR / "demand" / "metrics.json"
-    demand_schema = {
-        "type": "array",
-        "items": {
-            "type": "object",
-            "required": ["slug", "job_postings_7d", "job_postings_30d"],
-            "properties": {
-                "slug": {"type": "string", "pattern": "^[a-z0-9-]+$"},
-                "job_postings_7d": {"type": "integer", "minimum": 0},
-                "job_postings_30d": {"type": "integer", "minimum": 0}
-            }
-        }
-    }
-    
-    if not validate_file(demand_path, demand_schema, "Demand metrics"):
+    if not validate_file(demand_path, compile_validator(DEMAND_SCHEMA), "Demand metrics"):
         all_valid = False
     
     # Validate role salaries
     salaries_path = DATA_DIR / "salaries" / "role_salaries.json"
-    salaries_schema = {
-        "type": "object",
-        "patternProperties": {
-            "^.+$": {  # Role names
-                "type": "object",
-                "required": ["median_usd", "p25", "p75", "source"],
-                "properties": {
-                    "median_usd": {"type": "integer", "minimum": 0},
-                    "p25": {"type": "integer", "minimum": 0},
-                    "p75": {"type": "integer", "minimum": 0},
-                    "source": {"type": "string"}
-                }
-            }
-        }
-    }
-    
-    if not validate_file(salaries_path, salaries_schema, "Role salaries"):
+    if not validate_file(salaries_path, compile_validator(SALARIES_SCHEMA), "Role salaries"):
         all_valid = False
     
     return all_valid
@@ -5,14 +5,31 @@ Validates schemas and checks referential integrity
 """
 
 import json
+import mmap
+import os
 import pathlib
-from typing import Dict, List, Any, Set, Tuple
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, FrozenSet, List, Any, Optional, Tuple
 import jsonschema
-from jsonschema import validate, ValidationError
+from jsonschema import ValidationError
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 DATA_DIR = ROOT / "web" / "public" / "data"
 SCHEMAS_DIR = ROOT / "schemas"
+MMAP_MIN_BYTES = 64 * 1024  # Smaller files are cheaper to read into memory
+MAX_ERRORS = 100  # Stop validating further files once more errors than this are collected
+
+# Compiled validators keyed by id() of the schema dict; the schema is kept alongside so its id stays unique
+_VALIDATOR_CACHE: Dict[int, Tuple[Dict, Any]] = {}
+
+# Certification array schema, set in each shard validation worker process by init_shard_worker
+_worker_shard_schema: Optional[Dict] = None
 
 class ValidationResult:
     def __init__(self):
@@ -20,6 +37,7 @@ class ValidationResult:
         self.warnings: List[str] = []
         self.passed_files: List[str] = []
         self.failed_files: List[str] = []
+        self.skipped_files: List[str] = []
 
     def add_error(self, message: str):
         self.errors.append(message)
@@ -36,9 +54,22 @@ class ValidationResult:
     def is_valid(self) -> bool:
         return len(self.errors) == 0
 
+    def error_limit_reached(self, *skipped: str) -> bool:
+        """Check the error cap, recording the `skipped` files as not validated once it is exceeded"""
+        if len(self.errors) <= MAX_ERRORS:
+            return False
+        self.skipped_files.extend(skipped)
+        return True
+
 def load_json(path: pathlib.Path) -> Any:
-    """Load JSON file safely"""
+    """Load JSON file safely; large files are parsed straight from a read-only mmap"""
     try:
+        if orjson is not None:
+            if path.stat().st_size > MMAP_MIN_BYTES:
+                with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    with memoryview(mapped) as view:
+                        return orjson.loads(view)
+            return orjson.loads(path.read_bytes())
         with open(path, "r", encoding="utf-8") as f:
             return json.load(f)
     except Exception as e:
@@ -49,10 +80,25 @@ def load_schema(schema_name: str) -> Dict:
     schema_path = SCHEMAS_DIR / f"{schema_name}.schema.json"
     return load_json(schema_path)
 
+def get_validator(schema: Dict) -> Any:
+    """Return the compiled validator for a schema, checking and building it on first use"""
+    cached = _VALIDATOR_CACHE.get(id(schema))
+    if cached is None:
+        validator_class = jsonschema.validators.validator_for(schema)
+        validator_class.check_schema(schema)
+        cached = _VALIDATOR_CACHE[id(schema)] = (schema, validator_class(schema))
+    return cached[1]
+
+def validate_instance(instance: Any, schema: Dict) -> None:
+    """Raise the best matching ValidationError, like jsonschema.validate, using the cached validator"""
+    error = jsonschema.exceptions.best_match(get_validator(schema).iter_errors(instance))
+    if error is not None:
+        raise error
+
 def validate_json_schema(data: Any, schema: Dict, file_path: str, result: ValidationResult) -> bool:
     """Validate data against JSON schema"""
     try:
-        validate(instance=data, schema=schema)
+        validate_instance(data, schema)
         result.add_passed_file(file_path)
         return True
     except ValidationError as e:
@@ -61,11 +107,45 @@ def validate_json_schema(data: Any, schema: Dict, file_path: str, result: Valida
         result.add_failed_file(file_path)
         return False
 
+def init_shard_worker(shard_schema: Dict) -> None:
+    """Hand the certification array schema to a worker process once"""
+    global _worker_shard_schema
+    _worker_shard_schema = shard_schema
+
+def validate_shard(shard_path: pathlib.Path) -> Tuple[Optional[int], List[Tuple[Any, Optional[str]]]]:
+    """Schema-validate one shard in a worker process.
+    
+    Returns the number of certifications (None if the shard is not an array) and, for each
+    certification, its slug and schema error message (None when valid).
+    """
+    shard_data = load_json(shard_path)
+    if not isinstance(shard_data, list):
+        return None, []
+    
+    # Validate the whole shard in one pass, grouping errors by certification index
+    errors_by_item = defaultdict(list)
+    for error in get_validator(_worker_shard_schema).iter_errors(shard_data):
+        errors_by_item[error.path[0]].append(error)
+    
+    items = []
+    for i, cert in enumerate(shard_data):
+        item_errors = errors_by_item.get(i)
+        if item_errors:
+            e = jsonschema.exceptions.best_match(item_errors)
+            cert_path = list(e.path)[1:]
+            error_path = " → ".join(str(p) for p in cert_path) if cert_path else f"item {i}"
+            items.append((None, f"{e.message} at {error_path}"))
+        else:
+            items.append((cert.get("slug"), None))
+    
+    return len(shard_data), items
+
 def validate_certifications(result: ValidationResult) -> Dict[str, Any]:
     """Validate all certification shards and index"""
     print("🔍 Validating certifications...")
     
     cert_schema = load_schema("certification")
+    shard_schema = {"type": "array", "items": cert_schema}
     all_certifications = {}
     
     # Validate shard map
@@ -75,60 +155,80 @@ def validate_certifications(result: ValidationResult) -> Dict[str, Any]:
         return all_certifications
     
     shard_map = load_json(shard_map_path)
-    
-    # Validate each shard
+    shards = []
     for shard_info in shard_map.get("shards", []):
-        shard_file = shard_info["file"].replace("/data/", "")
-        shard_path = DATA_DIR / shard_file
-        
-        if not shard_path.exists():
-            result.add_error(f"Shard file not found: {shard_file}")
-            continue
+        # rel_path is relative to DATA_DIR; maps written before it existed only have the web path
+        shard_file = shard_info.get("rel_path") or shard_info["file"].replace("/data/", "")
+        shards.append((shard_info, shard_file, DATA_DIR / shard_file))
+    
+    # List each shard directory once instead of stat-ing every shard file
+    present = {}
+    for _, _, shard_path in shards:
+        if shard_path.parent not in present:
+            try:
+                with os.scandir(shard_path.parent) as entries:
+                    present[shard_path.parent] = {entry.name for entry in entries}
+            except OSError:
+                present[shard_path.parent] = set()
+    
+    # Schema-validate the shards in parallel; results are merged below in map order so
+    # duplicate slugs across shards are still detected
+    with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=init_shard_worker,
+                             initargs=(shard_schema,)) as executor:
+        futures = [
+            executor.submit(validate_shard, shard_path) if shard_path.name in present[shard_path.parent] else None
+            for _, _, shard_path in shards
+        ]
         
-        try:
-            shard_data = load_json(shard_path)
+        for i, ((shard_info, shard_file, shard_path), future) in enumerate(zip(shards, futures)):
+            if result.error_limit_reached(*(remaining for _, remaining, _ in shards[i:])):
+                executor.shutdown(wait=False, cancel_futures=True)
+                break
             
-            # Validate shard is array
-            if not isinstance(shard_data, list):
-                result.add_error(f"Shard {shard_file} must be an array")
+            if future is None:
+                result.add_error(f"Shard file not found: {shard_file}")
                 continue
             
-            # Validate count matches
-            if len(shard_data) != shard_info["count"]:
-                result.add_warning(f"Shard {shard_file} count mismatch: expected {shard_info['count']}, got {len(shard_data)}")
-            
-            # Validate each certification in shard
-            valid_shard = True
-            for i, cert in enumerate(shard_data):
-                try:
-                    validate(instance=cert, schema=cert_schema)
+            try:
+                shard_count, items = future.result()
+                
+                # Validate shard is array
+                if shard_count is None:
+                    result.add_error(f"Shard {shard_file} must be an array")
+                    continue
+                
+                # Validate count matches
+                if shard_count != shard_info["count"]:
+                    result.add_warning(f"Shard {shard_file} count mismatch: expected {shard_info['count']}, got {shard_count}")
+                
+                valid_shard = True
+                for i, (slug, schema_error) in enumerate(items):
+                    if schema_error is not None:
+                        result.add_error(f"Schema validation failed for {shard_file}[{i}]: {schema_error}")
+                        valid_shard = False
+                        continue
                     
-                    # Check for duplicate slugs
-                    slug = cert.get("slug")
-                    if slug in all_certifications:
-                        result.add_error(f"Duplicate slug '{slug}' in {shard_file} and {all_certifications[slug]}")
+                    # Check for duplicate slugs with a single lookup
+                    origin = all_certifications.get(slug)
+                    if origin is not None:
+                        result.add_error(f"Duplicate slug '{slug}' in {shard_file} and {origin}")
                         valid_shard = False
                     else:
                         all_certifications[slug] = shard_file
+                
+                if valid_shard:
+                    result.add_passed_file(shard_file)
+                else:
+                    result.add_failed_file(shard_file)
                     
-                except ValidationError as e:
-                    error_path = " → ".join(str(p) for p in e.path) if e.path else f"item {i}"
-                    result.add_error(f"Schema validation failed for {shard_file}[{i}]: {e.message} at {error_path}")
-                    valid_shard = False
-            
-            if valid_shard:
-                result.add_passed_file(shard_file)
-            else:
+            except Exception as e:
+                result.add_error(f"Error processing shard {shard_file}: {e}")
                 result.add_failed_file(shard_file)
-                
-        except Exception as e:
-            result.add_error(f"Error processing shard {shard_file}: {e}")
-            result.add_failed_file(shard_file)
     
     print(f"  📊 Found {len(all_certifications)} unique certifications")
     return all_certifications
 
-def validate_rankings(result: ValidationResult, cert_slugs: Set[str]) -> Dict[str, Any]:
+def validate_rankings(result: ValidationResult, cert_slugs: FrozenSet[str]) -> Dict[str, Any]:
     """Validate rankings and check referential integrity"""
     print("🏆 Validating rankings...")
     
@@ -137,7 +237,7 @@ def validate_rankings(result: ValidationResult, cert_slugs: Set[str]) -> Dict[st
     
     # Validate today.json
     today_path = DATA_DIR / "rankings" / "today.json"
-    if today_path.exists():
+    if today_path.exists() and not result.error_limit_reached("rankings/today.json"):
         try:
             today_data = load_json(today_path)
             validate_json_schema(today_data, rankings_schema, "rankings/today.json", result)
@@ -155,22 +255,24 @@ def validate_rankings(result: ValidationResult, cert_slugs: Set[str]) -> Dict[st
     
     # Validate trends.json
     trends_path = DATA_DIR / "rankings" / "trends.json"
-    if trends_path.exists():
+    if trends_path.exists() and not result.error_limit_reached("rankings/trends.json"):
         try:
             trends_data = load_json(trends_path)
             validate_json_schema(trends_data, rankings_schema, "rankings/trends.json", result)
             
-            # Check referential integrity
-            for slug, trend_data in trends_data.items():
-                if slug not in cert_slugs:
-                    result.add_error(f"Rankings trends.json references non-existent certification: {slug}")
+            # Check referential integrity with one set difference
+            missing = trends_data.keys() - cert_slugs
+            if missing:
+                for slug in trends_data:
+                    if slug in missing:
+                        result.add_error(f"Rankings trends.json references non-existent certification: {slug}")
                     
         except Exception as e:
             result.add_error(f"Error validating rankings/trends.json: {e}")
     
     return ranking_data
 
-def validate_companies(result: ValidationResult, cert_slugs: Set[str]):
+def validate_companies(result: ValidationResult, cert_slugs: FrozenSet[str]):
     """Validate company data"""
     print("🏢 Validating companies...")
     
@@ -178,7 +280,7 @@ def validate_companies(result: ValidationResult, cert_slugs: Set[str]):
     
     # Validate by_domain.json
     by_domain_path = DATA_DIR / "companies" / "by_domain.json"
-    if by_domain_path.exists():
+    if by_domain_path.exists() and not result.error_limit_reached("companies/by_domain.json"):
         try:
             by_domain_data = load_json(by_domain_path)
             validate_json_schema(by_domain_data, companies_schema, "companies/by_domain.json", result)
@@ -187,17 +289,23 @@ def validate_companies(result: ValidationResult, cert_slugs: Set[str]):
     
     # Validate recommendations.json
     recommendations_path = DATA_DIR / "companies" / "recommendations.json"
-    if recommendations_path.exists():
+    if recommendations_path.exists() and not result.error_limit_reached("companies/recommendations.json"):
         try:
             recommendations_data = load_json(recommendations_path)
             
-            # Check referential integrity
-            for domain, companies in recommendations_data.items():
-                for company_slug, recommendations in companies.items():
-                    for rec in recommendations:
-                        slug = rec.get("slug")
-                        if slug not in cert_slugs:
-                            result.add_error(f"Company recommendations references non-existent certification: {slug}")
+            # Check referential integrity with one set difference, walking the
+            # recommendations again in order only when something is missing
+            referenced_slugs = [
+                rec.get("slug")
+                for companies in recommendations_data.values()
+                for recommendations in companies.values()
+                for rec in recommendations
+            ]
+            missing = set(referenced_slugs) - cert_slugs
+            if missing:
+                for slug in referenced_slugs:
+                    if slug in missing:
+                        result.add_error(f"Company recommendations references non-existent certification: {slug}")
             
             result.add_passed_file("companies/recommendations.json")
             
@@ -235,6 +343,7 @@ def print_validation_report(result: ValidationResult):
     print(f"\n📊 Summary:")
     print(f"  ✅ Passed files: {len(result.passed_files)}")
     print(f"  ❌ Failed files: {len(result.failed_files)}")
+    print(f"  ⏭️  Skipped files: {len(result.skipped_files)}")
     print(f"  ⚠️  Warnings: {len(result.warnings)}")
     print(f"  🚨 Errors: {len(result.errors)}")
     
@@ -253,6 +362,11 @@ def print_validation_report(result: ValidationResult):
         for file in result.failed_files:
             print(f"  • {file}")
     
+    if result.skipped_files:
+        print(f"\n⏭️  Skipped files (error limit of {MAX_ERRORS} exceeded):")
+        for file in result.skipped_files:
+            print(f"  • {file}")
+    
     print("\n" + "="*60)
     
     return result.is_valid()
@@ -266,7 +380,7 @@ def main():
     try:
         # Validate certifications and get all slugs
         cert_data = validate_certifications(result)
-        cert_slugs = set(cert_data.keys())
+        cert_slugs = frozenset(cert_data)
         
         # Validate rankings with referential integrity
         validate_rankings(result, cert_slugs)
@@ -8,6 +8,7 @@ import certificationsData from '../data/certifications.json';
 
 interface ShardInfo {
   file: string;
+  rel_path?: string;
   letters: string;
   count: number;
   size_bytes: number;